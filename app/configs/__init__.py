@@ -7,8 +7,20 @@ from dotenv import dotenv_values
 import warnings
 from typing import Union
 
+# Prefer libyaml's C loader; it parses the same documents many times faster
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 warnings.filterwarnings(action="ignore")
 
+# Matches "${key}" placeholders in config values
+_PLACEHOLDER_RE = re.compile(r"\$\{(\w+)\}")
+
+# Set DEBUG=1 to always parse YAML configs directly instead of using the JSON cache
+DEBUG = os.environ.get("DEBUG", "").lower() in ("1", "true", "yes")
+
 
 def get_ancestor_dir(start_path: Union[str, Path], steps: int) -> Path:
     if not isinstance(steps, int) or steps < 0:
@@ -35,49 +47,85 @@ def get_ancestor_dir(start_path: Union[str, Path], steps: int) -> Path:
 
 def _load_yaml_file(filepath: str):
     """Loads a single YAML file."""
-    if os.path.exists(filepath):
-        try:
-            with open(filepath, "r") as f:
-                return yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            print(f"Error loading YAML file '{filepath}': {e}")
-            return {}
-    return {}
+    try:
+        with open(filepath, "r") as f:
+            return yaml.load(f, Loader=_Loader)
+    except FileNotFoundError:
+        return {}
+    except yaml.YAMLError as e:
+        print(f"Error loading YAML file '{filepath}': {e}")
+        return {}
 
 
-def _load_json_file(filepath: str):
-    """Loads a single YAML file."""
-    if os.path.exists(filepath):
-        try:
-            with open(filepath, "r") as f:
+def _load_yaml_cached(filepath: str):
+    """
+    Loads a YAML file through a JSON sidecar (".<name>.json" next to it) that is
+    only re-generated when the YAML file is newer, since json.load is much
+    cheaper than YAML parsing at startup.
+    """
+    directory, filename = os.path.split(filepath)
+    cache_path = os.path.join(directory, f".{filename}.json")
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(filepath):
+            with open(cache_path, "r") as f:
                 return json.load(f)
-        except json.JSONDecodeError as e:
-            print(f"Error loading JSON file '{filename}': {e}")
-    return {}
+    except (OSError, ValueError):
+        pass  # Missing, stale or unreadable cache: fall back to the YAML file
+
+    loaded_data = _load_yaml_file(filepath)
+    # Write to a temp file and rename so readers never see a partial cache
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(loaded_data, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        # Read-only directory or values JSON can't represent: skip caching
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return loaded_data
+
+
+def _load_json_file(filepath: str):
+    """Loads a single JSON file."""
+    try:
+        with open(filepath, "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except json.JSONDecodeError as e:
+        print(f"Error loading JSON file '{filepath}': {e}")
+        return {}
 
 
 def _load_env(filepath: str = ".env"):
     """Loads environment variables from a .env file in the configs directory."""
-    if os.path.exists(filepath):
-        return dotenv_values(filepath)
-    else:
-        print(f"Warning: .env file '{filename}' not found at '{filepath}'")
+    try:
+        with open(filepath, "r") as f:
+            return dotenv_values(stream=f)
+    except FileNotFoundError:
+        print(f"Warning: .env file not found at '{filepath}'")
         return {}
 
 
-def _resolve_placeholders(data, original_data: dict):
+def _transform(data, replacements: dict, placeholder_src: dict):
     """
-    Recursively replaces placeholder strings (e.g., '${key}' or '<KEY_NAME>')
-    in a dictionary or list using values from the all_replacements dictionary.
+    Recursively resolves '${key}' placeholders (from placeholder_src) and literal
+    replacements (e.g. '<ROOT_PATH>') in a dictionary or list in a single walk.
     """
     if isinstance(data, dict):
-        return {k: _resolve_placeholders(v, original_data) for k, v in data.items()}
+        return {
+            k: _transform(v, replacements, placeholder_src) for k, v in data.items()
+        }
     elif isinstance(data, list):
-        return [_resolve_placeholders(item, original_data) for item in data]
+        return [_transform(item, replacements, placeholder_src) for item in data]
     elif isinstance(data, str):
-        for match in re.findall(r"\$\{(\w+)\}", data):
-            replacement_value = original_data.get(match)
-            data = data.replace(f"${{{match}}}", f"{replacement_value}")
+        # Placeholders first, so substituted values get literal replacements too
+        data = _PLACEHOLDER_RE.sub(
+            lambda match: f"{placeholder_src.get(match.group(1))}", data
+        )
+        for old_value, new_value in replacements.items():
+            data = data.replace(old_value, new_value)
         return data
     else:
         return data
@@ -144,110 +192,16 @@ def load_file(filename, DIR):
         )
     # Load YAML files
     elif filename.endswith((".yaml", ".yml")):
-        loaded_data = _load_yaml_file(filepath)
+        if DEBUG:
+            loaded_data = _load_yaml_file(filepath)
+        else:
+            loaded_data = _load_yaml_cached(filepath)
     # Load JSON files
     elif filename.endswith((".json")):
         loaded_data = _load_json_file(filepath)
     return loaded_data, sanitized_config_name
 
 
-def print_directory_structure(
-    startpath: str,
-    include_extensions: list = None,
-    exclude_dirs: list = None,
-    show_hidden: bool = False,
-    file_prefix: str = "📄 ",
-    dir_prefix: str = "📁 ",
-):
-    """
-    Displays the directory structure in a readable, tree-like format.
-
-    Args:
-        startpath (str): The path to the root directory of the tree.
-        include_extensions (list, optional): A list of file extensions to include (e.g., ['.py']).
-                                             If None, all files are shown. Defaults to None.
-        exclude_dirs (list, optional): A list of directory names to exclude. Defaults to common ones.
-        show_hidden (bool): If True, shows hidden files and directories (those starting with '.').
-        file_prefix (str): Emoji or string to prepend to files.
-        dir_prefix (str): Emoji or string to prepend to directories.
-    """
-    if exclude_dirs is None:
-        exclude_dirs = ["__pycache__", ".git", ".vscode"]
-
-    try:
-        path_obj = Path(startpath)
-        if not path_obj.is_dir():
-            print(f"Error: '{startpath}' is not a valid directory.")
-            return
-    except Exception as e:
-        print(f"Error validating path: {e}")
-        return
-
-    print(f"{dir_prefix}{path_obj.name}/")
-    _print_tree_recursive(
-        path_obj,
-        prefix="",
-        include_extensions=include_extensions,
-        exclude_dirs=set(exclude_dirs),
-        show_hidden=show_hidden,
-        file_prefix=file_prefix,
-        dir_prefix=dir_prefix,
-    )
-
-
-def _print_tree_recursive(
-    dir_path: Path,
-    prefix: str,
-    include_extensions: list,
-    exclude_dirs: set,
-    show_hidden: bool,
-    file_prefix: str,
-    dir_prefix: str,
-):
-    """Recursive helper function to print the tree."""
-    # Get contents, applying filters
-    try:
-        contents = [
-            p
-            for p in dir_path.iterdir()
-            if (show_hidden or not p.name.startswith("."))
-            and p.name not in exclude_dirs
-        ]
-    except PermissionError:
-        print(f"{prefix}└── [Permission Denied]")
-        return
-
-    # Separate files and directories
-    files = sorted([p for p in contents if p.is_file()])
-    dirs = sorted([p for p in contents if p.is_dir()])
-
-    # Apply extension filter
-    if include_extensions:
-        files = [f for f in files if f.suffix in include_extensions]
-
-    entries = dirs + files
-
-    for i, path in enumerate(entries):
-        # Use '└──' for the last item, '├──' for others
-        connector = "└── " if i == len(entries) - 1 else "├── "
-
-        if path.is_dir():
-            print(f"{prefix}{connector}{dir_prefix}{path.name}/")
-            # The prefix for children adds space for the current connector
-            child_prefix = prefix + ("    " if i == len(entries) - 1 else "│   ")
-            _print_tree_recursive(
-                path,
-                child_prefix,
-                include_extensions,
-                exclude_dirs,
-                show_hidden,
-                file_prefix,
-                dir_prefix,
-            )
-        else:
-            print(f"{prefix}{connector}{file_prefix}{path.name}")
-
-
 def handle_env_path(filedir, filename):
     loaded_data = None
     filepath = os.path.join(filedir, ".env")
@@ -267,6 +221,10 @@ ENV_KEYS = [
     "SECRET_KEY",
     "MONGO_URI",
     "MONGO_DB",
+    "MONGO_POOL_MAX",
+    "MONGO_POOL_MIN",
+    "MONGO_COMPRESSORS",
+    "REDIS_URL",
     "EMAIL_FROM",
     "WHATSAPP_API_KEY",
 ]
@@ -280,17 +238,38 @@ replacements = {"<ROOT_PATH>": str(PROJECT_ROOT)}
 __include__ = [(".env", REPO_ROOT), ("configs.yaml", CONFIGS_DIR)]
 
 
-# Iterate through all files in the configs directory
-for values in __include__:
-    filename, filedir = values
+# Config sections already loaded, keyed by the module attribute they are exposed as
+_loaded = {}
+
+
+def _config_name(filename: str) -> str:
+    """Returns the module attribute name an included config file is exposed as."""
+    sanitized_config_name = _sanitize_name(os.path.splitext(filename)[0])
+    if filename.endswith(".env"):
+        return sanitized_config_name or "env"
+    return sanitized_config_name
+
+
+def _load_config(filename: str, filedir: str):
+    """Loads one included config file and resolves its replacements/placeholders."""
     if filename == ".env":
         loaded_data = handle_env_path(filedir, filename)
         if loaded_data is not None:
-            globals()["env"] = loaded_data
-            continue
-    filepath = os.path.join(filedir, filename)
-    loaded_data, sanitized_config_name = load_file(filename, filedir)
-    for key, value in replacements.items():
-        loaded_data = recursive_replace(loaded_data, old_value=key, new_value=value)
-    loaded_data = _resolve_placeholders(loaded_data, loaded_data)
-    globals()[sanitized_config_name] = loaded_data
+            return loaded_data
+    loaded_data, _ = load_file(filename, filedir)
+    return _transform(loaded_data, replacements, loaded_data)
+
+
+def __getattr__(name: str):
+    """
+    Loads config sections (e.g. `env`, `configs`) on first access, so a bare
+    `import app.configs` doesn't pay for parsing files it never reads.
+    """
+    if name not in _loaded:
+        for filename, filedir in __include__:
+            if _config_name(filename) == name:
+                _loaded[name] = _load_config(filename, filedir)
+                break
+        else:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _loaded[name]
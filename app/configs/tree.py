@@ -0,0 +1,103 @@
+# app/configs/tree.py
+"""
+Development helpers for printing a directory tree. Kept out of the config
+package's __init__ so importing configs doesn't load them.
+"""
+from pathlib import Path
+
+
+def print_directory_structure(
+    startpath: str,
+    include_extensions: list = None,
+    exclude_dirs: list = None,
+    show_hidden: bool = False,
+    file_prefix: str = "📄 ",
+    dir_prefix: str = "📁 ",
+):
+    """
+    Displays the directory structure in a readable, tree-like format.
+
+    Args:
+        startpath (str): The path to the root directory of the tree.
+        include_extensions (list, optional): A list of file extensions to include (e.g., ['.py']).
+                                             If None, all files are shown. Defaults to None.
+        exclude_dirs (list, optional): A list of directory names to exclude. Defaults to common ones.
+        show_hidden (bool): If True, shows hidden files and directories (those starting with '.').
+        file_prefix (str): Emoji or string to prepend to files.
+        dir_prefix (str): Emoji or string to prepend to directories.
+    """
+    if exclude_dirs is None:
+        exclude_dirs = ["__pycache__", ".git", ".vscode"]
+
+    try:
+        path_obj = Path(startpath)
+        if not path_obj.is_dir():
+            print(f"Error: '{startpath}' is not a valid directory.")
+            return
+    except Exception as e:
+        print(f"Error validating path: {e}")
+        return
+
+    print(f"{dir_prefix}{path_obj.name}/")
+    _print_tree_recursive(
+        path_obj,
+        prefix="",
+        include_extensions=include_extensions,
+        exclude_dirs=set(exclude_dirs),
+        show_hidden=show_hidden,
+        file_prefix=file_prefix,
+        dir_prefix=dir_prefix,
+    )
+
+
+def _print_tree_recursive(
+    dir_path: Path,
+    prefix: str,
+    include_extensions: list,
+    exclude_dirs: set,
+    show_hidden: bool,
+    file_prefix: str,
+    dir_prefix: str,
+):
+    """Recursive helper function to print the tree."""
+    # Get contents, applying filters
+    try:
+        contents = [
+            p
+            for p in dir_path.iterdir()
+            if (show_hidden or not p.name.startswith("."))
+            and p.name not in exclude_dirs
+        ]
+    except PermissionError:
+        print(f"{prefix}└── [Permission Denied]")
+        return
+
+    # Separate files and directories
+    files = sorted([p for p in contents if p.is_file()])
+    dirs = sorted([p for p in contents if p.is_dir()])
+
+    # Apply extension filter
+    if include_extensions:
+        files = [f for f in files if f.suffix in include_extensions]
+
+    entries = dirs + files
+
+    for i, path in enumerate(entries):
+        # Use '└──' for the last item, '├──' for others
+        connector = "└── " if i == len(entries) - 1 else "├── "
+
+        if path.is_dir():
+            print(f"{prefix}{connector}{dir_prefix}{path.name}/")
+            # The prefix for children adds space for the current connector
+            child_prefix = prefix + ("    " if i == len(entries) - 1 else "│   ")
+            _print_tree_recursive(
+                path,
+                child_prefix,
+                include_extensions,
+                exclude_dirs,
+                show_hidden,
+                file_prefix,
+                dir_prefix,
+            )
+        else:
+            print(f"{prefix}{connector}{file_prefix}{path.name}")
@@ -1,66 +1,108 @@
 # app/dependencies/auth.py
-from fastapi import Depends, HTTPException, status
+import asyncio
+import re
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional, Tuple
+from beanie import PydanticObjectId
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from app.services.auth_service import AuthService
-from app.services.user_service import UserService
-from app.schemas.user import UserLogin  # Import UserLogin schema
-from app.models.user import User  # Import User model
+from app.services.auth_service import get_auth_service
+from app.services.user_service import get_user_service
+from app.schemas.user import UserLogin, UserAuthProj  # Import UserLogin schema
+from app.models.user import EMAIL_PATTERN, User  # Import User model
+from app.configs import configs
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="users/login")
 
-auth_service = AuthService()
-user_service = UserService()
+auth_service = get_auth_service()
+user_service = get_user_service()
 
+# Cheap shape check for login identifiers, so obviously bogus attempts are
+# rejected before touching the database or hashing a password
+_EMAIL_RE = re.compile(EMAIL_PATTERN)
 
-async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
+# Per-client token bucket for the login endpoints: each address may make
+# `capacity` attempts in a burst, refilled at `refill_per_second`
+_rate_limit_conf = configs.get("login_rate_limit", {})
+_BUCKET_CAPACITY = float(_rate_limit_conf.get("capacity", 10))
+_BUCKET_REFILL = float(_rate_limit_conf.get("refill_per_second", 0.2))
+_buckets = TTLCache(
+    maxsize=_rate_limit_conf.get("maxsize", 10000),
+    ttl=_BUCKET_CAPACITY / _BUCKET_REFILL,  # an idle bucket is full again by then
+)
+_buckets_lock = threading.Lock()
+
+
+def is_plausible_email(value: str) -> bool:
+    """Returns True if the value looks like an email address."""
+    return bool(value) and len(value) <= 254 and _EMAIL_RE.match(value) is not None
+
+
+def login_rate_limit(request: Request) -> None:
     """
-    Dependency that decodes the JWT token and fetches the current authenticated user.
-    Raises HTTPException if the token is invalid or the user is not found/active.
+    Dependency that throttles login attempts per client address.
+    Raises HTTPException 429 once the client's bucket is empty.
     """
-    try:
-        payload = auth_service.decode_access_token(token)
-        user_email: str = payload.get("sub")
-        if user_email is None:
+    host = request.client.host if request.client else "unknown"
+    now = time.monotonic()
+    with _buckets_lock:
+        tokens, last = _buckets.get(host, (_BUCKET_CAPACITY, now))
+        tokens = min(_BUCKET_CAPACITY, tokens + (now - last) * _BUCKET_REFILL)
+        if tokens < 1:
+            _buckets[host] = (tokens, now)
             raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Could not validate credentials",
-                headers={"WWW-Authenticate": "Bearer"},
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many login attempts, please try again later",
             )
+        _buckets[host] = (tokens - 1, now)
 
-        user = await user_service.get_user_by_email(user_email)
-        if user is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        if not user.is_active:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user"
-            )
-        return user
-    except HTTPException:
-        raise
-    except Exception:
+
+async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
+    """
+    Dependency that decodes the JWT token and fetches the current authenticated user.
+    Raises HTTPException if the token is invalid or the user is not found/active.
+    """
+    # decode_access_token reports every invalid or expired token as a 401 itself;
+    # unexpected errors (e.g. database outages) propagate to FastAPI's error handling
+    payload = auth_service.decode_access_token(token)
+    user_email: str = payload.get("sub")
+    if user_email is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    user = await user_service.get_cached_user_by_email(user_email)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user"
+        )
+    return user
+
 
 async def authenticate_user_dependency(
     user_login: UserLogin,
-) -> User:  # <--- CHANGE RETURN TYPE TO User
+    _: None = Depends(login_rate_limit),
+) -> UserAuthProj:
     """
     Dependency that authenticates a user based on email and password.
-    It returns the authenticated User object on success.
+    It returns the authenticated user's login fields (a projection, not the
+    full User document) on success.
     Raises HTTPException on failure.
     """
-    user = await user_service.get_user_by_email(user_login.email)
-    if not user or not auth_service.verify_password(
-        user_login.password, user.hashed_password
+    user = await user_service.get_user_by_email_for_auth(user_login.email)
+    if not await auth_service.verify_login_async(
+        user_login.email, user_login.password, user
     ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -73,16 +115,60 @@ async def authenticate_user_dependency(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user"
         )
 
+    # Transparently upgrade legacy or outdated hashes now that we know the password
+    if auth_service.needs_rehash(user.hashed_password):
+        await user_service.set_password_hash(
+            user, await auth_service.hash_password_async(user_login.password)
+        )
+
     # You might also want to check for is_verified here if it's a requirement for login
     # if not user.is_verified:
     #     raise HTTPException(
     #         status_code=status.HTTP_400_BAD_REQUEST, detail="User not verified"
     #     )
 
-    # IMPORTANT CHANGE: Directly return the User object
     return user
 
 
+def current_and_target_user(
+    guard: Callable[[User], Awaitable[User]],
+    fetch_target: Optional[Callable[[PydanticObjectId], Awaitable[Any]]] = None,
+):
+    """
+    Builds a dependency for routes acting on the user named by the `user_id` path
+    parameter. Once the token is verified, it loads the caller and that target
+    user concurrently, then applies `guard` (e.g. a role check) to the caller.
+    `fetch_target` loads the target (the full User by default; routes that only
+    check permissions can pass a projection such as get_user_role_and_status).
+    Returns (current_user, target_user); target_user is None if it doesn't exist.
+
+    The caller is resolved here rather than through Depends(get_current_user),
+    so routes using this dependency must take current_user from its result and
+    not also inject get_current_user (that would load the caller twice).
+    """
+    fetch_target = fetch_target or user_service.get_user_by_id
+
+    async def dependency(
+        user_id: PydanticObjectId, token: str = Depends(oauth2_scheme)
+    ) -> Tuple[User, Optional[Any]]:
+        # Reject bad tokens before touching the target, so anonymous requests
+        # can't trigger database reads (or cache fills) for arbitrary users.
+        # The decode is cached, so get_current_user repeats it for free.
+        auth_service.decode_access_token(token)
+        # Both are awaited to completion even if one fails, so no lookup is left
+        # running after the request has been answered
+        current_user, target_user = await asyncio.gather(
+            get_current_user(token), fetch_target(user_id), return_exceptions=True
+        )
+        for result in (current_user, target_user):
+            if isinstance(result, BaseException):
+                raise result
+        await guard(current_user)
+        return current_user, target_user
+
+    return dependency
+
+
 def create_access_token_dependency():  # No change needed here
     """
     Dependency that provides a callable function to create JWT access tokens.
@@ -0,0 +1,26 @@
+# app/dependencies/hierarchy.py
+from typing import FrozenSet
+from fastapi import Depends
+from app.models.user import User, SCOPED_ROLES
+from app.services.admin_unit_service import get_admin_unit_service
+from app.dependencies.auth import get_current_user
+
+admin_unit_service = get_admin_unit_service()
+
+
+async def get_user_scope_unit_ids(
+    current_user: User = Depends(get_current_user),
+) -> FrozenSet[str]:
+    """
+    Dependency that resolves the IDs of the administrative units the current
+    user may see: their associated units plus all descendants. FastAPI resolves
+    it once per request, and the service caches it briefly across requests.
+    Super Admins and read-only users aren't scoped, so they get an empty set.
+    """
+    if current_user.role not in SCOPED_ROLES:
+        return frozenset()
+    if not current_user.associated_administrative_units:
+        return frozenset()
+    return await admin_unit_service.get_scope_unit_ids(
+        current_user.associated_administrative_units
+    )
@@ -1,9 +1,155 @@
 import os
+import json
+import asyncio
+import threading
+import time
+from functools import lru_cache
+from typing import Optional
 import pandas as pd
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+try:
+    import fcntl  # POSIX only; the disk cache is unlocked elsewhere
+except ImportError:
+    fcntl = None
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "politrack", "forms"
+)
+
+
+@lru_cache(maxsize=8)
+def _get_creds(service_account_file: str, scopes: tuple):
+    """Loads service account credentials once per (key file, scopes)."""
+    try:
+        return service_account.Credentials.from_service_account_file(
+            service_account_file, scopes=list(scopes)
+        )
+    except Exception as e:
+        raise Exception(f"Authentication failed: {e}")
+
+
+@lru_cache(maxsize=32)
+def _get_service(service_account_file: str, scopes: tuple, thread_id: int):
+    """
+    Builds a Forms API client once per (key file, scopes, thread). The discovery
+    document is read from the installed package rather than downloaded, and
+    clients are per thread because their httplib2 connection isn't thread-safe.
+    """
+    try:
+        return build(
+            "forms",
+            "v1",
+            credentials=_get_creds(service_account_file, scopes),
+            static_discovery=True,
+        )
+    except Exception as e:
+        raise Exception(f"Failed to build Forms API service: {e}")
+
+
+# Each extractor turns an answer object's "answers" list into one cell value;
+# multiple answers to a question (e.g. checkboxes) are joined with ", ".
+
+
+def _extract_values(answers: list) -> Optional[str]:
+    """Text, choice and scale answers carry their value (a string) directly."""
+    return ", ".join(a["value"] for a in answers if a.get("value") is not None) or None
+
+
+def _format_date(ans: dict) -> str:
+    """
+    Formats a date answer as YEAR-MM-DD. Parts the form didn't ask for are left
+    out: a missing year leaves its segment empty (e.g. "-05-03"), a missing
+    month or day is 00.
+    """
+    return f"{ans.get('year', '')}-{ans.get('month', 0):02d}-{ans.get('day', 0):02d}"
+
+
+def _extract_dates(answers: list) -> Optional[str]:
+    """Date answers can have year, month, day."""
+    return ", ".join(_format_date(ans) for ans in answers) or None
+
+
+def _extract_times(answers: list) -> Optional[str]:
+    """Time answers can have hour, minute."""
+    return (
+        ", ".join(
+            f"{ans.get('hours', 0):02d}:{ans.get('minutes', 0):02d}" for ans in answers
+        )
+        or None
+    )
+
+
+# Answer-object key -> extractor for its "answers" list
+_EXTRACTORS = {
+    "textAnswers": _extract_values,
+    "choiceAnswers": _extract_values,
+    "scaleAnswers": _extract_values,
+    "dateAnswers": _extract_dates,
+    "timeAnswers": _extract_times,
+}
+
+
+# Question kinds in the order they're checked, with how each is described
+_TYPES = (
+    "textQuestion",
+    "choiceQuestion",
+    "scaleQuestion",
+    "dateQuestion",
+    "timeQuestion",
+    "paragraphQuestion",
+    "fileUploadQuestion",
+)
+_TYPE_LABELS = {
+    "textQuestion": "Text",
+    "dateQuestion": "Date",
+    "timeQuestion": "Time",
+    "paragraphQuestion": "Paragraph Text",  # Long text
+    "fileUploadQuestion": "File Upload",
+}
+
+
+def _describe_question_type(question: dict) -> str:
+    """Returns a readable type for a question from the form definition."""
+    kind = next((t for t in _TYPES if t in question), None)
+    if kind == "choiceQuestion":
+        choices = ", ".join(c.get("value") for c in question[kind].get("options", []))
+        return f"Choice ({choices})"
+    if kind == "scaleQuestion":
+        scale = question[kind]
+        return f"Scale ({scale.get('low')}-{scale.get('high')})"
+    return _TYPE_LABELS.get(kind, "Unknown Question Type")
+
+
+def _render_structure(form_def: dict) -> str:
+    """Renders the text printed by `GoogleFormsReader.print_form_structure`."""
+    lines = [
+        "\n--- Form Structure ---",
+        f"Title: {form_def.get('info', {}).get('title', 'N/A')}",
+        f"Form ID: {form_def.get('formId', 'N/A')}",
+        "\nQuestions:",
+    ]
+    if "items" in form_def:
+        for item in form_def["items"]:
+            item_id = item.get("itemId", "N/A")
+            if "questionItem" in item:
+                question = item["questionItem"]["question"]
+                question_text = question.get("text", {}).get("text", "N/A")
+                lines.append(f"  - Item ID: {item_id}")
+                lines.append(f"    Question: {question_text}")
+                lines.append(f"    Type: {_describe_question_type(question)}")
+            else:
+                # Items that are not questions (e.g., sections, images, videos, titles)
+                title = item.get("title", "No Title")
+                lines.append(
+                    f"  - Item ID: {item_id}, Type: {item.get('itemType', 'N/A')}, Title: {title}"
+                )
+    else:
+        lines.append("  No questions found.")
+    return "\n".join(lines)
+
 
 class GoogleFormsReader:
     """
@@ -11,7 +157,13 @@ class GoogleFormsReader:
     to retrieve form metadata and responses, with options to process into a DataFrame.
     """
 
-    def __init__(self, service_account_file: str, form_id: str, scopes: list = None):
+    def __init__(
+        self,
+        service_account_file: str,
+        form_id: str,
+        scopes: list = None,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+    ):
         """
         Initializes the GoogleFormsReader with service account credentials and form ID.
 
@@ -20,6 +172,8 @@ class GoogleFormsReader:
             form_id (str): The ID of your Google Form.
             scopes (list, optional): List of OAuth 2.0 scopes.
                                      Defaults to forms.body and forms.responses.readonly.
+            cache_dir (str, optional): Directory for the on-disk form definition cache.
+                                       Pass None to disable it.
         """
         if not os.path.exists(service_account_file):
             raise FileNotFoundError(
@@ -39,71 +193,135 @@ class GoogleFormsReader:
             self.scopes = scopes
 
         self._creds = self._authenticate()
-        self._forms_service = self._build_service()
         self._form_definition = None  # Cache for form definition
         self._question_id_to_title_map = None  # Cache for question mapping
+        self._rendered_structure = None  # (revisionId, text) for print_form_structure
+
+        # Definition persisted by an earlier process; validated against the
+        # form's current revisionId before it is used
+        self.cache_dir = cache_dir
+        self._disk_cache = self._read_disk_cache()
 
     def _authenticate(self):
         """Authenticates with Google using the service account file."""
-        try:
-            creds = service_account.Credentials.from_service_account_file(
-                self.service_account_file, scopes=self.scopes
-            )
-            return creds
-        except Exception as e:
-            raise Exception(f"Authentication failed: {e}")
+        return _get_creds(self.service_account_file, tuple(self.scopes))
+
+    @property
+    def _forms_service(self):
+        """The Google Forms API service client for the calling thread."""
+        return _get_service(
+            self.service_account_file, tuple(self.scopes), threading.get_ident()
+        )
 
-    def _build_service(self):
-        """Builds the Google Forms API service client."""
+    def _disk_cache_path(self):
+        """Path of this form's cache file, or None if the disk cache is disabled."""
+        if not self.cache_dir:
+            return None
+        # Different service accounts may see different forms under the same ID
+        account = getattr(self._creds, "service_account_email", "") or "default"
+        return os.path.join(self.cache_dir, f"{self.form_id}.{account}.json")
+
+    def _read_disk_cache(self):
+        """Loads the persisted form definition entry, if there is one."""
+        path = self._disk_cache_path()
+        if path is None:
+            return None
         try:
-            return build("forms", "v1", credentials=self._creds)
+            # Writers swap the file in with os.replace, so a reader always sees
+            # either the old entry or the new one, never a partial write
+            with open(path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk_cache(self, definition: dict):
+        """Persists the form definition along with its revisionId."""
+        path = self._disk_cache_path()
+        if path is None:
+            return
+        entry = {
+            "revisionId": definition.get("revisionId"),
+            "definition": definition,
+            "fetched_at": time.time(),
+        }
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Lock the target while replacing it so concurrent writers don't interleave
+            with open(f"{path}.lock", "w") as lock:
+                if fcntl:
+                    fcntl.flock(lock, fcntl.LOCK_EX)
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w") as f:
+                    json.dump(entry, f)
+                os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Warning: could not write form cache '{path}': {e}")
+
+    def _fetch_form(self, fields: str = None) -> dict:
+        """Fetches the form definition (or only `fields` of it) from the API."""
+        try:
+            if fields:
+                return (
+                    self._forms_service.forms()
+                    .get(formId=self.form_id, fields=fields)
+                    .execute()
+                )
+            return self._forms_service.forms().get(formId=self.form_id).execute()
+        except HttpError as err:
+            if err.resp.status == 404:
+                raise ValueError(
+                    f"Form with ID '{self.form_id}' not found or service account lacks access."
+                )
+            else:
+                raise HttpError(f"Error fetching form definition: {err}")
         except Exception as e:
-            raise Exception(f"Failed to build Forms API service: {e}")
+            raise Exception(
+                f"An unexpected error occurred while fetching form definition: {e}"
+            )
 
     def _get_form_definition_cached(self):
-        """Retrieves and caches the form definition."""
+        """
+        Retrieves and caches the form definition. A definition persisted on disk
+        is reused when the form's revisionId hasn't changed, which costs a much
+        smaller request than fetching the full form.
+        """
         if self._form_definition is None:
-            try:
-                self._form_definition = (
-                    self._forms_service.forms().get(formId=self.form_id).execute()
-                )
-            except HttpError as err:
-                if err.resp.status == 404:
-                    raise ValueError(
-                        f"Form with ID '{self.form_id}' not found or service account lacks access."
-                    )
-                else:
-                    raise HttpError(f"Error fetching form definition: {err}")
-            except Exception as e:
-                raise Exception(
-                    f"An unexpected error occurred while fetching form definition: {e}"
-                )
+            cached = self._disk_cache
+            if cached and cached.get("revisionId"):
+                current = self._fetch_form(fields="revisionId")
+                if current.get("revisionId") == cached["revisionId"]:
+                    self._form_definition = cached["definition"]
+            if self._form_definition is None:
+                self._form_definition = self._fetch_form()
+                self._write_disk_cache(self._form_definition)
         return self._form_definition
 
+    def _iter_questions(self):
+        """Yields (questionId, question) for every question in the form definition."""
+        for item in self._get_form_definition_cached().get("items", []):
+            question = item.get("questionItem", {}).get("question")
+            if question and question.get("questionId"):
+                yield question["questionId"], question
+
     def _map_question_ids_to_titles(self):
         """
-        Parses the form definition to create a mapping from Forms API itemId (question_id)
-        to the actual human-readable question title.
+        Parses the form definition to create a mapping from question_id (the key
+        responses use for answers) to the actual human-readable question title.
         Caches the map for efficiency.
         """
         if self._question_id_to_title_map is None:
             form_def = self._get_form_definition_cached()
-            question_map = {}
-            for item in form_def.get("items", []):
-                item_id = item.get("itemId")
-
-                # The actual question title can be in different places depending on item type
-                title = None
-                if "title" in item:  # Direct title for items
-                    title = item["title"]
-                elif "questionItem" in item:  # For actual questions
-                    question_item = item["questionItem"]
-                    if "question" in question_item:
-                        title = question_item["question"].get("text", {}).get("text")
-
-                if item_id and title:
-                    question_map[item_id] = title.strip()
-            self._question_id_to_title_map = question_map
+            # The title is on the item itself, or on the question for older definitions
+            titles = {
+                (question.get("questionId") or item.get("itemId")): (
+                    item.get("title") or question.get("text", {}).get("text") or ""
+                ).strip()
+                for item in form_def.get("items", ())
+                for question in (item.get("questionItem", {}).get("question", {}),)
+            }
+            self._question_id_to_title_map = {
+                qid: title for qid, title in titles.items() if qid and title
+            }
         return self._question_id_to_title_map
 
     def get_form_metadata(self) -> dict:
@@ -116,24 +334,15 @@ class GoogleFormsReader:
         print(f"Fetching metadata for form ID: {self.form_id}")
         return self._get_form_definition_cached()
 
-    def get_raw_responses(self) -> list:
-        """
-        Retrieves and returns the raw responses from the Google Form.
-
-        Returns:
-            list: A list of dictionaries, where each dictionary represents a raw response.
-        """
-        print(f"Fetching raw responses for form ID: {self.form_id}")
+    def _list_responses_page(self, page_size: int, page_token: str = None) -> dict:
+        """Fetches one page of responses from the API."""
         try:
-            result = (
+            return (
                 self._forms_service.forms()
                 .responses()
-                .list(formId=self.form_id)
+                .list(formId=self.form_id, pageSize=page_size, pageToken=page_token)
                 .execute()
             )
-            responses = result.get("responses", [])
-            print(f"Retrieved {len(responses)} raw responses.")
-            return responses
         except HttpError as err:
             if err.resp.status == 404:
                 raise ValueError(
@@ -146,6 +355,93 @@ class GoogleFormsReader:
                 f"An unexpected error occurred while fetching raw responses: {e}"
             )
 
+    def iter_raw_responses(self, page_size: int = 1000):
+        """
+        Yields the raw responses from the Google Form one at a time, fetching
+        them page by page so only one page is held in memory.
+
+        Args:
+            page_size (int): Responses requested per API call (the API caps it at 5000).
+
+        Yields:
+            dict: A raw response.
+        """
+        print(f"Fetching raw responses for form ID: {self.form_id}")
+        page_token = None
+        while True:
+            result = self._list_responses_page(page_size, page_token)
+            yield from result.get("responses", [])
+            page_token = result.get("nextPageToken")
+            if not page_token:
+                break
+
+    def get_raw_responses(self) -> list:
+        """
+        Retrieves and returns the raw responses from the Google Form.
+
+        Returns:
+            list: A list of dictionaries, where each dictionary represents a raw response.
+        """
+        responses = list(self.iter_raw_responses())
+        print(f"Retrieved {len(responses)} raw responses.")
+        return responses
+
+    def _collect_columns(self, map_columns_to_titles: bool) -> tuple:
+        """
+        Streams the form's responses into one list per column.
+
+        Returns:
+            tuple: (columns, n_rows) where columns maps column name -> list of
+                   cell values, each exactly n_rows long.
+        """
+        question_title_map = (
+            self._map_question_ids_to_titles() if map_columns_to_titles else {}
+        )
+
+        # Build the data column-wise: one preallocated list per column, filled by
+        # row index, instead of a dict per row that has to be re-aligned.
+        # Responses are streamed page by page, so the buffers double when full
+        # and columns are added as new questions show up.
+        capacity = 1024
+        n_rows = 0
+        columns = {"response_id": [None] * capacity, "submit_time": [None] * capacity}
+        # question_id -> column name, resolved once per question rather than per cell
+        col_of = {}
+        for i, response in enumerate(self.iter_raw_responses()):
+            if i == capacity:
+                for values in columns.values():
+                    values.extend([None] * capacity)
+                capacity *= 2
+            n_rows = i + 1
+            columns["response_id"][i] = response.get("responseId")
+            columns["submit_time"][i] = response.get("createTime")
+
+            # Iterate through answers and extract values based on type
+            for question_id, answer_obj in response.get("answers", {}).items():
+                column_name = col_of.get(question_id)
+                if column_name is None:
+                    column_name = question_title_map.get(
+                        question_id, f"question_{question_id}"
+                    )
+                    col_of[question_id] = column_name
+                    if column_name not in columns:
+                        columns[column_name] = [None] * capacity
+
+                cell = None
+                # One dict lookup per answer key instead of testing every type in turn
+                for key, typed_answers in answer_obj.items():
+                    extract = _EXTRACTORS.get(key)
+                    if extract is not None:
+                        if typed_answers.get("answers"):
+                            cell = extract(typed_answers["answers"])
+                        break
+                # Other answer types (e.g. fileUploadAnswers) have no extractor yet
+                columns[column_name][i] = cell
+
+        for values in columns.values():
+            del values[n_rows:]
+        return columns, n_rows
+
     def get_responses_dataframe(
         self, map_columns_to_titles: bool = True
     ) -> pd.DataFrame:
@@ -160,130 +456,145 @@ class GoogleFormsReader:
         Returns:
             pd.DataFrame: A DataFrame containing the form responses.
         """
-        raw_responses = self.get_raw_responses()
-        if not raw_responses:
+        print("Processing responses into DataFrame...")
+        columns, n_rows = self._collect_columns(map_columns_to_titles)
+        if not n_rows:
             print("No responses to process into a DataFrame.")
             return pd.DataFrame()
 
-        question_title_map = (
-            self._map_question_ids_to_titles() if map_columns_to_titles else {}
-        )
-        data_for_df = []
+        df = pd.DataFrame(columns, copy=False)
+        print("DataFrame created successfully.")
+        return df
 
-        print("Processing responses into DataFrame...")
-        for response in raw_responses:
-            row_data = {
-                "response_id": response.get("responseId"),
-                "submit_time": response.get("createTime"),
-            }
+    def get_responses_arrow(self, map_columns_to_titles: bool = True):
+        """
+        Retrieves form responses as a pyarrow Table, for callers that load them
+        into a columnar store (e.g. DuckDB can query the table directly) and
+        don't need pandas' object-dtype columns. Requires pyarrow.
 
-            # Iterate through answers and extract values based on type
-            for question_id, answer_obj in response.get("answers", {}).items():
-                column_name = question_title_map.get(
-                    question_id, f"question_{question_id}"
-                )
+        Args:
+            map_columns_to_titles (bool): Same as in `get_responses_dataframe`.
 
-                answer_values = []
-                if "textAnswers" in answer_obj and answer_obj["textAnswers"].get(
-                    "answers"
-                ):
-                    answer_values = [
-                        ans.get("value") for ans in answer_obj["textAnswers"]["answers"]
-                    ]
-                elif "choiceAnswers" in answer_obj and answer_obj["choiceAnswers"].get(
-                    "answers"
-                ):
-                    answer_values = [
-                        ans.get("value")
-                        for ans in answer_obj["choiceAnswers"]["answers"]
-                    ]
-                elif "scaleAnswers" in answer_obj and answer_obj["scaleAnswers"].get(
-                    "answers"
-                ):
-                    answer_values = [
-                        ans.get("value")
-                        for ans in answer_obj["scaleAnswers"]["answers"]
-                    ]
-                elif "dateAnswers" in answer_obj and answer_obj["dateAnswers"].get(
-                    "answers"
-                ):
-                    # Date answers can have year, month, day. Join them or format as needed.
-                    answer_values = [
-                        f"{ans.get('year', '')}-{str(ans.get('month', '')).zfill(2)}-{str(ans.get('day', '')).zfill(2)}"
-                        for ans in answer_obj["dateAnswers"]["answers"]
-                    ]
-                elif "timeAnswers" in answer_obj and answer_obj["timeAnswers"].get(
-                    "answers"
-                ):
-                    # Time answers can have hour, minute. Join them.
-                    answer_values = [
-                        f"{str(ans.get('hours', '')).zfill(2)}:{str(ans.get('minutes', '')).zfill(2)}"
-                        for ans in answer_obj["timeAnswers"]["answers"]
-                    ]
-                # Add more conditions for other answer types (e.g., fileUploadAnswers, correctAnswers, etc.)
-                # If there are multiple answers for a single question (e.g., checkboxes), join them
-                row_data[column_name] = (
-                    ", ".join(map(str, answer_values)) if answer_values else None
-                )
+        Returns:
+            pyarrow.Table: One row per response. submit_time is a UTC timestamp
+                           (nanosecond precision, as the API reports it),
+                           choice questions are dictionary-encoded and other
+                           answers are strings.
+        """
+        import pyarrow as pa  # Optional dependency, only needed here
 
-            data_for_df.append(row_data)
+        columns, n_rows = self._collect_columns(map_columns_to_titles)
 
-        df = pd.DataFrame(data_for_df)
-        print("DataFrame created successfully.")
-        return df
+        # Columns whose values come from a fixed set of options
+        question_title_map = (
+            self._map_question_ids_to_titles() if map_columns_to_titles else {}
+        )
+        choice_columns = {
+            question_title_map.get(qid, f"question_{qid}")
+            for qid, question in self._iter_questions()
+            if "choiceQuestion" in question
+        }
+
+        arrays = {}
+        for name, values in columns.items():
+            array = pa.array(values, type=pa.string())
+            if name == "submit_time":
+                # createTime is RFC 3339 with up to 9 fractional digits
+                array = array.cast(pa.timestamp("ns", tz="UTC"))
+            elif name in choice_columns:
+                array = array.dictionary_encode()
+            arrays[name] = array
+        return pa.table(arrays)
+
+    # --- Async variants ---
+    # The googleapiclient calls above block, so from async code (e.g. FastAPI
+    # handlers) use these instead: each runs the whole job in a worker thread,
+    # keeping the event loop free. A job stays on one thread because the
+    # underlying httplib2 connection isn't safe to share between threads.
+
+    async def get_form_metadata_async(self) -> dict:
+        """Async variant of `get_form_metadata`."""
+        return await asyncio.to_thread(self.get_form_metadata)
+
+    async def get_raw_responses_async(self) -> list:
+        """Async variant of `get_raw_responses`."""
+        return await asyncio.to_thread(self.get_raw_responses)
+
+    async def get_responses_dataframe_async(
+        self, map_columns_to_titles: bool = True
+    ) -> pd.DataFrame:
+        """Async variant of `get_responses_dataframe`."""
+        return await asyncio.to_thread(
+            self.get_responses_dataframe, map_columns_to_titles
+        )
 
     def print_form_structure(self):
         """Prints a human-readable structure of the form's questions."""
         form_def = self.get_form_metadata()
-        print("\n--- Form Structure ---")
-        print(f"Title: {form_def.get('info', {}).get('title', 'N/A')}")
-        print(f"Form ID: {form_def.get('formId', 'N/A')}")
-        print("\nQuestions:")
-        if "items" in form_def:
-            for item in form_def["items"]:
-                item_id = item.get("itemId", "N/A")
-                title = item.get("title", "No Title")
-                if "questionItem" in item:
-                    question = item["questionItem"]["question"]
-                    question_text = question.get("text", {}).get("text", "N/A")
-                    # question_type = question.get(
-                    #     "questionId", "N/A"
-                    # )
-                    # Forms API doesn't directly provide a simple 'type' here, 'questionId' is usually the itemID
-
-                    # More accurate type from properties
-                    if "textQuestion" in question:
-                        type_str = "Text"
-                    elif "choiceQuestion" in question:
-                        type_str = "Choice"
-                        choices = [
-                            c.get("value")
-                            for c in question["choiceQuestion"].get("options", [])
-                        ]
-                        type_str += f" ({', '.join(choices)})"
-                    elif "scaleQuestion" in question:
-                        type_str = f"Scale ({question['scaleQuestion'].get('low')}-{question['scaleQuestion'].get('high')})"
-                    elif "dateQuestion" in question:
-                        type_str = "Date"
-                    elif "timeQuestion" in question:
-                        type_str = "Time"
-                    elif "paragraphQuestion" in question:  # Long text
-                        type_str = "Paragraph Text"
-                    elif "fileUploadQuestion" in question:
-                        type_str = "File Upload"
-                    else:
-                        type_str = "Unknown Question Type"
-
-                    print(f"  - Item ID: {item_id}")
-                    print(f"    Question: {question_text}")
-                    print(f"    Type: {type_str}")
-                else:
-                    # Items that are not questions (e.g., sections, images, videos, titles)
-                    print(
-                        f"  - Item ID: {item_id}, Type: {item.get('itemType', 'N/A')}, Title: {title}"
-                    )
-        else:
-            print("  No questions found.")
+        # The rendering only changes when the form itself does
+        revision_id = form_def.get("revisionId")
+        cached = self._rendered_structure
+        if cached is None or cached[0] != revision_id:
+            self._rendered_structure = (revision_id, _render_structure(form_def))
+        print(self._rendered_structure[1])
+
+
+# The Google batch endpoint accepts at most this many calls per request
+_MAX_BATCH_SIZE = 100
+
+
+def fetch_many(readers: list, page_size: int = 1000) -> dict:
+    """
+    Fetches the raw responses of several forms, sending the first page request
+    for every form in one batched HTTP call instead of one round-trip each.
+    Forms with more than one page are then paged through individually.
+
+    Args:
+        readers (list): GoogleFormsReader instances, one per form.
+        page_size (int): Responses requested per API call.
+
+    Returns:
+        dict: form ID -> list of raw responses.
+    """
+    results = {reader.form_id: [] for reader in readers}
+    next_tokens = {}
+    errors = []
+
+    def on_page(request_id, response, exception):
+        reader = readers[int(request_id)]
+        if exception is not None:
+            errors.append((reader.form_id, exception))
+            return
+        results[reader.form_id].extend(response.get("responses", []))
+        if response.get("nextPageToken"):
+            next_tokens[int(request_id)] = response["nextPageToken"]
+
+    for start in range(0, len(readers), _MAX_BATCH_SIZE):
+        chunk = readers[start : start + _MAX_BATCH_SIZE]
+        # Each call keeps its own reader's credentials inside the batch
+        batch = chunk[0]._forms_service.new_batch_http_request(callback=on_page)
+        for offset, reader in enumerate(chunk):
+            batch.add(
+                reader._forms_service.forms()
+                .responses()
+                .list(formId=reader.form_id, pageSize=page_size),
+                request_id=str(start + offset),
+            )
+        batch.execute()
+
+    if errors:
+        form_id, exception = errors[0]
+        raise Exception(
+            f"Error fetching raw responses for form '{form_id}': {exception}"
+        )
+
+    for index, page_token in next_tokens.items():
+        reader = readers[index]
+        while page_token:
+            result = reader._list_responses_page(page_size, page_token)
+            results[reader.form_id].extend(result.get("responses", []))
+            page_token = result.get("nextPageToken")
+    return results
 
 
 # # --- Example Usage ---
@@ -1,22 +1,23 @@
 # app/main.py
 import os
 from fastapi import FastAPI
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 from beanie import init_beanie
-from pymongo import AsyncMongoClient
 
 import logging
 
 from app.configs import env, configs
-from app.models.user import User
+from app.services import cache, db
+from app.models.user import User, AuditLogEntry
 from app.models.hierarchy import (
     AdminUnit,
     # AdministrativeUnitType,
 )
 from app.routes import users, auth, hierarchy  # Import new routes
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -25,18 +26,18 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 STATIC_DIR = os.path.join(PROJECT_ROOT, "static")
 TEMPLATES_DIR = os.path.join(PROJECT_ROOT, "templates")
 
-# Debugging checks (optional, but good practice)
-if not os.path.isdir(STATIC_DIR):
-    print(f"ERROR: Static directory not found at {STATIC_DIR}")
-if not os.path.isdir(TEMPLATES_DIR):
-    print(f"ERROR: Templates directory not found at {TEMPLATES_DIR}")
-
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
+# Debugging checks (optional, but good practice)
+if not os.path.isdir(STATIC_DIR):
+    logger.error("Static directory not found at %s", STATIC_DIR)
+if not os.path.isdir(TEMPLATES_DIR):
+    logger.error("Templates directory not found at %s", TEMPLATES_DIR)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -45,30 +46,45 @@ async def lifespan(app: FastAPI):
     Connects to MongoDB and initializes Beanie ODM.
     """
     logger.info("Application startup initiated...")
+    # One client (and connection pool) per worker, shared via app.state and db.py
+    client = db.create_mongo_client()
     try:
-        client = AsyncMongoClient(env.get("MONGO_URI"))
         # Ensure database name is correctly read from settings
         await init_beanie(
-            database=client[env.get("MONGO_DB")], document_models=[User, AdminUnit]
+            database=client[env.get("MONGO_DB")],
+            document_models=[User, AuditLogEntry, AdminUnit],
         )
         logger.info("MongoDB connection and Beanie initialization successful.")
     except Exception as e:
         logger.error(f"Failed to connect to MongoDB or initialize Beanie: {e}")
-        # Depending on severity, you might want to re-raise or exit here
+        await client.close()
         raise
+    app.state.mongo = client
+    db.db_client = client
+    # Optional shared cache; None unless REDIS_URL is configured
+    redis_client = cache.create_redis_client()
+    cache.redis_client = redis_client
 
-    yield
-
-    logger.info("Application shutdown initiated...")
-    # Clean up resources if necessary
-    client.close()
-    logger.info("MongoDB connection closed.")
+    try:
+        yield
+    finally:
+        logger.info("Application shutdown initiated...")
+        db.db_client = None
+        await client.close()  # AsyncMongoClient.close() is a coroutine
+        logger.info("MongoDB connection closed.")
+        if redis_client is not None:
+            cache.redis_client = None
+            await redis_client.aclose()
+            logger.info("Redis connection closed.")
 
 
 app = FastAPI(
     title=configs.get("app").get("project_name"),
     debug=configs.get("app").get("debug_mode"),
     lifespan=lifespan,  # Use the lifespan manager
+    # Response models are still serialized by pydantic-core; orjson then renders
+    # the result to bytes instead of the stdlib json module
+    default_response_class=ORJSONResponse,
 )
 
 origins = [
@@ -85,6 +101,9 @@ app.add_middleware(
     ],  # Allow all HTTP methods (GET, POST, PUT, DELETE, OPTIONS, etc.)
     allow_headers=["*"],  # Allow all headers in the request
 )
+# Added last so it is the outermost middleware and compresses every response,
+# CORS ones included; bodies under 1 KB aren't worth compressing
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 # Include API routes
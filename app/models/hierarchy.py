@@ -3,6 +3,7 @@ from enum import Enum
 from typing import Optional, Dict, Any
 from pydantic import Field
 from beanie import Document
+from pymongo import ASCENDING, IndexModel
 
 
 # --- Administrative Unit Types (Customizable) ---
@@ -34,3 +35,13 @@ class AdminUnit(Document):
 
     class Settings:
         name = "admin_units"
+        # Hierarchy walks, scope resolution and has_children filter by parent
+        # (and often type); parent_id is the index prefix, so parent-only
+        # lookups use it too and a separate parent_id index would be redundant
+        indexes = [
+            IndexModel([("parent_id", ASCENDING), ("type", ASCENDING)]),
+            # get_admin_unit_by_name_and_type matches both fields; name-only
+            # lookups use the prefix. Not unique: the same name can recur under
+            # different parents (e.g. two districts of one name in two states)
+            IndexModel([("name", ASCENDING), ("type", ASCENDING)]),
+        ]
@@ -1,9 +1,41 @@
 # app/models/user.py
 from enum import Enum
-from typing import List, Optional, Any
-from datetime import datetime
-from pydantic import Field, EmailStr, ConfigDict, BaseModel  # Import BaseModel
-from beanie import Document, PydanticObjectId
+from typing import Annotated, List, Optional, Any
+from datetime import datetime, timezone
+from pydantic import AfterValidator, Field, StringConstraints
+from beanie import (
+    Document,
+    PydanticObjectId,
+    Insert,
+    Replace,
+    SaveChanges,
+    before_event,
+)
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+
+def utc_now() -> datetime:
+    """Current time as a timezone-aware UTC datetime (replaces datetime.utcnow)."""
+    return datetime.now(timezone.utc)
+
+
+# Shape check for email addresses: something@domain.tld, no whitespace
+EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+
+
+def _lower_email_domain(value: str) -> str:
+    """Lowercases the (case-insensitive) domain part, as EmailStr normalized it."""
+    local, _, domain = value.rpartition("@")
+    return f"{local}@{domain.lower()}"
+
+
+# An email address validated by pydantic-core's regex engine instead of the
+# email-validator package (no per-value Python parsing beyond the domain lowercase)
+EmailAddress = Annotated[
+    str,
+    StringConstraints(strip_whitespace=True, max_length=254, pattern=EMAIL_PATTERN),
+    AfterValidator(_lower_email_domain),
+]
 
 
 # --- UserRole Enum (Simplified) ---
@@ -16,25 +48,32 @@ class UserRole(str, Enum):
     GENERAL_READ_ONLY = "general_read_only"
 
 
+# Role groups used by the permission checks (frozensets, so membership tests
+# are hash lookups and nothing is rebuilt per request)
+PRIVILEGED_ROLES = frozenset({UserRole.SUPER_ADMIN, UserRole.GENERAL_READ_ONLY})
+SCOPED_ROLES = frozenset({UserRole.ADMIN, UserRole.USER})
+ELEVATED_ROLES = frozenset({UserRole.ADMIN, UserRole.SUPER_ADMIN})
+LOW_PRIV_ROLES = frozenset({UserRole.USER, UserRole.GENERAL_READ_ONLY})
+
+
 # --- Audit Log Entry Model ---
-class AuditLogEntry(BaseModel):  # <--- CHANGE THIS LINE: Inherit from BaseModel
+class AuditLogEntry(Document):
     """
     Represents an entry in a user's audit log for profile changes.
+    Stored in its own collection so loading a user never drags its history along.
     """
 
+    user_id: PydanticObjectId  # The user whose profile was changed
     changed_by_user_id: PydanticObjectId
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utc_now)
     field_name: str
     old_value: Any
     new_value: Any
 
-    class Config:  # <--- Optional: Add Pydantic v1 Config for JSON encoding, if needed for this specific model
-        json_encoders = {PydanticObjectId: str}
-        # If you were on Pydantic v2 exclusively, this would be model_config
-        # model_config = ConfigDict(json_encoders={PydanticObjectId: str})
-        # But for simple PydanticObjectId to str, it usually handles it automatically on BaseModel.
-        # It's safer to include for PydanticObjectId if you want explicit string conversion.
-        arbitrary_types_allowed = True  # Keep this if 'Any' type causes issues, but often not needed for BaseModel
+    class Settings:
+        name = "audit_log"
+        # A user's history is always read newest first
+        indexes = [IndexModel([("user_id", ASCENDING), ("timestamp", DESCENDING)])]
 
 
 # --- User Model ---
@@ -44,19 +83,17 @@ class User(Document):
     # )
     first_name: str
     last_name: Optional[str] = None
-    email: EmailStr = Field(unique=True)
+    email: EmailAddress = Field(unique=True)
     phone_number: Optional[str] = None  # Contact info for audit log concern
     hashed_password: str
     role: UserRole
     is_active: bool = True
     is_verified: bool = False
     profile_picture_url: Optional[str] = None
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow
-    )  # Make sure this is present and works
-    updated_at: datetime = Field(
-        default_factory=datetime.utcnow
-    )  # Make sure this is present and works
+    # Set by the insert/save hooks below rather than a default_factory, so
+    # loading documents from Mongo doesn't compute a throwaway timestamp
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     # This field defines the administrative scope for ADMINs and the location for USERs
     # A Super Admin typically wouldn't have this, or it would be []
@@ -68,14 +105,23 @@ class User(Document):
     # This is descriptive and can be derived from associated_administrative_units
     associated_hierarchy_levels: List[str] = Field(default_factory=list)
 
-    # Audit log for profile changes (specifically contact info)
-    audit_log: List[AuditLogEntry] = Field(default_factory=list)
+    @before_event(Insert)
+    def _set_created_timestamps(self):
+        now = utc_now()
+        self.created_at = self.created_at or now
+        self.updated_at = now
 
-    # We can likely remove arbitrary_types_allowed=True from User model's ConfigDict
-    # because AuditLogEntry is now a BaseModel, which Pydantic knows how to handle.
-    # However, it doesn't hurt to keep it if you have other arbitrary types.
-    # For now, let's keep it just in case, or you can try removing it after this fix.
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    @before_event(Replace, SaveChanges)
+    def _set_updated_timestamp(self):
+        self.updated_at = utc_now()
 
     class Settings:
         name = "users"  # MongoDB collection name
+        indexes = [
+            # Logins and token checks look users up by email; unique, so it also
+            # rejects duplicate registrations atomically
+            IndexModel([("email", ASCENDING)], unique=True),
+            # Admins list users filtered by role, paged in _id order (keyset
+            # pagination), so the index yields each page already sorted
+            IndexModel([("role", ASCENDING), ("_id", ASCENDING)]),
+        ]
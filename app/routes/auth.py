@@ -1,23 +1,31 @@
 # app/routes/auth.py
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from app.services.auth_service import AuthService
-from app.services.user_service import UserService
+from app.services.auth_service import get_auth_service
+from app.services.user_service import get_user_service
+from app.dependencies.auth import is_plausible_email, login_rate_limit
 from app.schemas.tokens import Token
 
 router = APIRouter()
-auth_service = AuthService()
-user_service = UserService()
+auth_service = get_auth_service()
+user_service = get_user_service()
 
 
-@router.post("/token", response_model=Token)
+@router.post("/token", response_model=Token, dependencies=[Depends(login_rate_limit)])
 async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends()):
     """
     Authenticates a user and returns an access token upon successful login.
     """
-    user = await user_service.get_user_by_email(form_data.username)
-    if not user or not auth_service.verify_password(
-        form_data.password, user.hashed_password
+    # The form field is free text, so reject non-emails before any lookup
+    if not is_plausible_email(form_data.username):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect username or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    user = await user_service.get_user_by_email_for_auth(form_data.username)
+    if not await auth_service.verify_login_async(
+        form_data.username, form_data.password, user
     ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -29,5 +37,10 @@ async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Inactive user",
         )
-    access_token = auth_service.create_access_token(data={"sub": user.email})
+    # Transparently upgrade legacy or outdated hashes now that we know the password
+    if auth_service.needs_rehash(user.hashed_password):
+        await user_service.set_password_hash(
+            user, await auth_service.hash_password_async(form_data.password)
+        )
+    access_token = auth_service.create_access_token(user.email)
     return {"access_token": access_token, "token_type": "bearer"}
@@ -1,24 +1,36 @@
 # app/routes/hierarchy.py
 from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
-from beanie import PydanticObjectId
+from fastapi.responses import StreamingResponse
+from typing import Any, AsyncIterator, Dict, FrozenSet, List
+import orjson
 
-# Correct import for AdminUnit (from models)
-from app.models.hierarchy import AdminUnit
-from app.models.user import User, UserRole
+from app.models.user import User, UserRole, PRIVILEGED_ROLES, SCOPED_ROLES
 
 # Correct imports for the Pydantic schemas (from schemas)
 from app.schemas.hierarchy import AdminUnitCreate, AdminUnitUpdate, AdminUnitPublic
 
-from app.services.admin_unit_service import AdminUnitService
+from app.services.admin_unit_service import get_admin_unit_service
 from app.dependencies.auth import get_current_user
+from app.dependencies.hierarchy import get_user_scope_unit_ids
 
 router = APIRouter()
-admin_unit_service = AdminUnitService()
+admin_unit_service = get_admin_unit_service()
+
+
+async def _json_array(docs: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    """Encodes documents as a JSON array one at a time (ObjectIds as strings)."""
+    yield b"["
+    first = True
+    async for doc in docs:
+        if not first:
+            yield b","
+        first = False
+        yield orjson.dumps(doc, default=str)
+    yield b"]"
 
 
 # --- Permissions Helper ---
-def require_super_admin(current_user: User):
+async def require_super_admin(current_user: User = Depends(get_current_user)):
     if current_user.role != UserRole.SUPER_ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -71,27 +83,23 @@ async def get_all_admin_units(current_user: User = Depends(get_current_user)):
     Admins and Users can see units relevant to their `associated_administrative_units` and their descendants.
     General Read Only can see all.
     """
-    if (
-        current_user.role == UserRole.SUPER_ADMIN
-        or current_user.role == UserRole.GENERAL_READ_ONLY
-    ):
-        units = await admin_unit_service.get_all_admin_units()
-        return [AdminUnitPublic.model_validate(unit) for unit in units]
-
-    if current_user.role in [UserRole.ADMIN, UserRole.USER]:
+    if current_user.role in PRIVILEGED_ROLES:
+        # The full listing can be large: stream it straight from the cursor
+        # (already in AdminUnitPublic's shape) instead of building it in memory
+        return StreamingResponse(
+            _json_array(admin_unit_service.iter_all_admin_units_raw()),
+            media_type="application/json",
+        )
+
+    if current_user.role in SCOPED_ROLES:
         if not current_user.associated_administrative_units:
             return []  # If no associated units, no units to show in scope
 
-        # Get all units within the user's scope (their units + all descendants)
-        allowed_unit_ids = await admin_unit_service.get_descendant_units_ids(
+        # The user's units + all descendants, fetched and shaped in one walk
+        return await admin_unit_service.get_scope_units_public(
             current_user.associated_administrative_units
         )
 
-        units = await AdminUnit.find(
-            {"_id": {"$in": [PydanticObjectId(uid) for uid in allowed_unit_ids]}}
-        ).to_list()
-        return [AdminUnitPublic.model_validate(unit) for unit in units]
-
     raise HTTPException(
         status_code=status.HTTP_403_FORBIDDEN,
         detail="Not authorized to view administrative units.",
@@ -100,7 +108,9 @@ async def get_all_admin_units(current_user: User = Depends(get_current_user)):
 
 @router.get("/{unit_id}", response_model=AdminUnitPublic)
 async def get_admin_unit_by_id(
-    unit_id: str, current_user: User = Depends(get_current_user)
+    unit_id: str,
+    current_user: User = Depends(get_current_user),
+    allowed_unit_ids: FrozenSet[str] = Depends(get_user_scope_unit_ids),
 ):
     """Retrieves a single administrative unit by ID."""
     unit = await admin_unit_service.get_admin_unit_by_id(unit_id)
@@ -111,13 +121,10 @@ async def get_admin_unit_by_id(
         )
 
     # Check permission based on role and scope
-    if (
-        current_user.role == UserRole.SUPER_ADMIN
-        or current_user.role == UserRole.GENERAL_READ_ONLY
-    ):
+    if current_user.role in PRIVILEGED_ROLES:
         return unit
 
-    if current_user.role in [UserRole.ADMIN, UserRole.USER]:
+    if current_user.role in SCOPED_ROLES:
         if not current_user.associated_administrative_units:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -125,9 +132,6 @@ async def get_admin_unit_by_id(
             )
 
         # Check if the requested unit is within the user's scope
-        allowed_unit_ids = await admin_unit_service.get_descendant_units_ids(
-            current_user.associated_administrative_units
-        )
         if unit_id not in allowed_unit_ids:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -168,8 +172,7 @@ async def delete_admin_unit(
 ):
     """Deletes an administrative unit (Super Admin only)."""
     # Optional: Prevent deletion if unit has children or associated users/tasks
-    children = await admin_unit_service.get_children_units(unit_id)
-    if children:
+    if await admin_unit_service.has_children(unit_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot delete administrative unit with active children units.",
@@ -1,9 +1,15 @@
 # app/routes/users.py
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from typing import List, Optional, Tuple
 from beanie import PydanticObjectId
 
-from app.models.user import User, UserRole, AuditLogEntry
+from app.models.user import (
+    User,
+    UserRole,
+    AuditLogEntry,
+    ELEVATED_ROLES,
+    LOW_PRIV_ROLES,
+)
 from app.schemas.user import (
     UserCreate,
     UserUpdate,
@@ -12,30 +18,26 @@ from app.schemas.user import (
     Token,
     PasswordChange,
     ProfileUpdate,
+    UserAuthProj,
+    UserRoleProj,
 )
-from app.services.user_service import UserService
-from app.services.auth_service import AuthService
+from app.services.user_service import get_user_service
+from app.services.auth_service import get_auth_service
 from app.dependencies.auth import (
     get_current_user,
     authenticate_user_dependency,
     create_access_token_dependency,
+    current_and_target_user,
 )  # Added create_access_token_dependency
 from app.schemas.misc import Message
 
 router = APIRouter()
-user_service = UserService()
-auth_service = AuthService()
-
-
-def handle_user_id(user_data):
-    if "_id" in user_data:
-        user_data["id"] = str(user_data["_id"])  # Assign to 'id' key for UserPublic
-        del user_data["_id"]
-    return user_data
+user_service = get_user_service()
+auth_service = get_auth_service()
 
 
 # Dependency to require Super Admin role
-def require_super_admin(current_user: User = Depends(get_current_user)):
+async def require_super_admin(current_user: User = Depends(get_current_user)):
     if current_user.role != UserRole.SUPER_ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -45,8 +47,10 @@ def require_super_admin(current_user: User = Depends(get_current_user)):
 
 
 # Dependency to require Admin or Super Admin role
-def require_admin_or_super_admin(current_user: User = Depends(get_current_user)):
-    if current_user.role not in [UserRole.ADMIN, UserRole.SUPER_ADMIN]:
+async def require_admin_or_super_admin(
+    current_user: User = Depends(get_current_user),
+):
+    if current_user.role not in ELEVATED_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only Admins or Super Admins are allowed to perform this action.",
@@ -54,6 +58,17 @@ def require_admin_or_super_admin(current_user: User = Depends(get_current_user))
     return current_user
 
 
+# Caller + target user (loaded concurrently) for routes taking a user_id. Routes
+# that only check the target's role get the lightweight projection instead.
+admin_and_target_user = current_and_target_user(require_admin_or_super_admin)
+admin_and_target_role = current_and_target_user(
+    require_admin_or_super_admin, user_service.get_user_role_and_status
+)
+super_admin_and_target_role = current_and_target_user(
+    require_super_admin, user_service.get_user_role_and_status
+)
+
+
 # --- Authentication Endpoints ---
 
 
@@ -71,18 +86,13 @@ async def register_user(
     Super Admins can assign any role. Admins can only assign 'USER' or 'GENERAL_READ_ONLY'.
     """
     if current_user.role == UserRole.ADMIN:
-        if user_create.role not in [UserRole.USER, UserRole.GENERAL_READ_ONLY]:
+        if user_create.role not in LOW_PRIV_ROLES:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Admins can only register 'user' or 'general_read_only' roles.",
             )
 
-    existing_user = await user_service.get_user_by_email(user_create.email)
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT, detail="Email already registered"
-        )
-
+    # Duplicate emails are rejected by the unique index; the service raises 409
     new_user = await user_service.create_user(user_create)
     if not new_user:
         raise HTTPException(
@@ -95,8 +105,7 @@ async def register_user(
 
 @router.post("/login", response_model=Token)
 async def login_for_access_token(
-    # CHANGE THIS LINE: Accept 'user' of type 'User'
-    user: User = Depends(authenticate_user_dependency),
+    user: UserAuthProj = Depends(authenticate_user_dependency),
     create_access_token_func: callable = Depends(
         create_access_token_dependency
     ),  # Renamed to avoid clash if 'create_access_token' is a module-level variable
@@ -105,7 +114,7 @@ async def login_for_access_token(
     Authenticate user and return an access token.
     """
     # Use the 'user' object directly
-    access_token = create_access_token_func({"sub": user.email})
+    access_token = create_access_token_func(user.email)
     return {"access_token": access_token, "token_type": "bearer"}
 
 
@@ -124,8 +133,11 @@ async def change_my_password(
     """
     Allows a user to change their own password.
     """
-    if not auth_service.verify_password(
-        password_change.old_password, current_user.hashed_password
+    # The current user may come from the cache, which never holds password
+    # hashes, so load the hash itself
+    credentials = await user_service.get_user_by_email_for_auth(current_user.email)
+    if not credentials or not await auth_service.verify_password_async(
+        password_change.old_password, credentials.hashed_password
     ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid old password"
@@ -137,8 +149,10 @@ async def change_my_password(
             detail="New password cannot be the same as old password",
         )
 
-    hashed_new_password = auth_service.hash_password(password_change.new_password)
-    await user_service.update_user(current_user.id, hashed_password=hashed_new_password)
+    hashed_new_password = await auth_service.hash_password_async(
+        password_change.new_password
+    )
+    await user_service.set_password_hash(current_user, hashed_new_password)
 
     return {"message": "Password updated successfully"}
 
@@ -151,43 +165,10 @@ async def update_my_profile(
     Allows a user to update their own profile information (first_name, last_name, phone_number, profile_picture_url).
     The email cannot be changed via this endpoint.
     """
-    # Create an audit log entry before updating sensitive fields if changed
-    audit_log_entries = []
-
-    # Check for phone_number change
-    if (
-        profile_update.phone_number is not None
-        and profile_update.phone_number != current_user.phone_number
-    ):
-        audit_log_entries.append(
-            {
-                "changed_by_user_id": current_user.id,
-                "field_name": "phone_number",
-                "old_value": current_user.phone_number,
-                "new_value": profile_update.phone_number,
-            }
-        )
-
-    # You can add more checks for other fields if needed, e.g., role or status changes
-    # For now, assuming only phone number for audit log based on previous requirements.
-
-    updated_user_data = profile_update.model_dump(exclude_unset=True)
-
-    # Add audit log entries to the update data if any changes were recorded
-    if audit_log_entries:
-        # Append the new log entries to the existing audit_log
-        # This requires fetching the current audit_log and extending it
-        existing_audit_log = current_user.audit_log
-        for entry_data in audit_log_entries:
-            # Create an AuditLogEntry instance (Pydantic will handle timestamp if default_factory)
-            entry = auth_service.AuditLogEntry(**entry_data)
-            existing_audit_log.append(entry)
-
-        # Ensure that updated_user_data reflects the full audit_log list
-        # This will overwrite the entire audit_log field in the database
-        updated_user_data["audit_log"] = existing_audit_log
-
-    updated_user = await user_service.update_user(current_user.id, **updated_user_data)
+    # Changes to audited fields are logged by the service
+    updated_user = await user_service.update_user(
+        current_user.id, profile_update, current_user.id
+    )
 
     if not updated_user:
         raise HTTPException(
@@ -202,47 +183,58 @@ async def update_my_profile(
 
 
 @router.get("/", response_model=List[UserPublic])
-async def get_all_users(current_user: User = Depends(require_admin_or_super_admin)):
+async def get_all_users(
+    response: Response,
+    limit: int = Query(100, ge=1, le=500),
+    after_id: Optional[PydanticObjectId] = None,
+    current_user: User = Depends(require_admin_or_super_admin),
+):
     """
     Retrieve a list of all users (Admin/Super Admin only).
     Admins can only see 'user' and 'general_read_only' roles. Super Admins see all.
+    Paginated by ID: when more users may follow, the `X-Next-Cursor` header holds
+    the value to pass as `after_id` for the next page.
     """
-    users = await user_service.get_all_users()
+    role_in = None
+    if current_user.role == UserRole.ADMIN:
+        role_in = LOW_PRIV_ROLES
+    users = await user_service.get_all_users(
+        limit=limit, role_in=role_in, after_id=after_id
+    )
+    if len(users) == limit:
+        response.headers["X-Next-Cursor"] = str(users[-1].id)
     return users
 
 
 @router.get("/{user_id}", response_model=UserPublic)
 async def get_user_by_id(
     user_id: PydanticObjectId,
-    current_user: User = Depends(require_admin_or_super_admin),
+    users: Tuple[User, Optional[User]] = Depends(admin_and_target_user),
 ):
     """
     Retrieve a single user by ID (Admin/Super Admin only).
     Admins can only see 'user' and 'general_read_only' roles. Super Admins see all.
     """
-    user = await user_service.get_user_by_id(user_id)
+    current_user, user = users
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
 
-    if current_user.role == UserRole.ADMIN and user.role not in [
-        UserRole.USER,
-        UserRole.GENERAL_READ_ONLY,
-    ]:
+    if current_user.role == UserRole.ADMIN and user.role not in LOW_PRIV_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admins are not authorized to view this user's details.",
         )
 
-    return handle_user_id(user)
+    return user
 
 
 @router.put("/{user_id}", response_model=UserPublic)
 async def update_user(
     user_id: PydanticObjectId,
     user_update: UserUpdate,
-    current_user: User = Depends(require_admin_or_super_admin),
+    users: Tuple[User, Optional[UserRoleProj]] = Depends(admin_and_target_role),
 ):
     """
     Update an existing user's details (Admin/Super Admin only).
@@ -250,8 +242,9 @@ async def update_user(
     Admins can update 'user' or 'general_read_only' roles only (excluding their own role to prevent self-escalation)
     and cannot change roles to ADMIN or SUPER_ADMIN.
     """
-    # Fetch the user to be updated to check permissions and existing values
-    target_user = await user_service.get_user_by_id(user_id)
+    # Role of the user to be updated, to check permissions (the service loads
+    # the full document for the audit log)
+    current_user, target_user = users
     if not target_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found."
@@ -260,92 +253,27 @@ async def update_user(
     # Permissions check for Admin
     if current_user.role == UserRole.ADMIN:
         # Admin cannot update Super Admin or other Admins
-        if (
-            target_user.role in [UserRole.SUPER_ADMIN, UserRole.ADMIN]
-            and target_user.id != current_user.id
-        ):
+        if target_user.role in ELEVATED_ROLES and target_user.id != current_user.id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Admins are not authorized to update users with 'admin' or 'super_admin' roles, or other admins.",
             )
         # Admin cannot change roles to ADMIN or SUPER_ADMIN
-        if user_update.role and user_update.role in [
-            UserRole.ADMIN,
-            UserRole.SUPER_ADMIN,
-        ]:
+        if user_update.role and user_update.role in ELEVATED_ROLES:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Admins cannot assign 'admin' or 'super_admin' roles.",
             )
         # Admin can only update users with 'user' or 'general_read_only' roles
-        if (
-            target_user.role not in [UserRole.USER, UserRole.GENERAL_READ_ONLY]
-            and target_user.id != current_user.id
-        ):
+        if target_user.role not in LOW_PRIV_ROLES and target_user.id != current_user.id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Admins can only update users with 'user' or 'general_read_only' roles.",
             )
 
-    # Prepare data for update, excluding fields that should not be changed by certain roles or at all
-    update_data = user_update.model_dump(exclude_unset=True)
-
-    # Handle password hashing if provided
-    if "password" in update_data:
-        update_data["hashed_password"] = auth_service.hash_password(
-            update_data.pop("password")
-        )
-
-    # Audit logging for sensitive changes (e.g., phone number, roles, activation status)
-    audit_log_entries = []
-
-    # Check for phone_number change (if it's allowed for admin to update others)
-    if (
-        "phone_number" in update_data
-        and update_data["phone_number"] != target_user.phone_number
-    ):
-        audit_log_entries.append(
-            {
-                "changed_by_user_id": current_user.id,
-                "field_name": "phone_number",
-                "old_value": target_user.phone_number,
-                "new_value": update_data["phone_number"],
-            }
-        )
-
-    # Check for role change
-    if "role" in update_data and update_data["role"] != target_user.role:
-        audit_log_entries.append(
-            {
-                "changed_by_user_id": current_user.id,
-                "field_name": "role",
-                "old_value": target_user.role.value,  # Store enum value
-                "new_value": update_data["role"].value,  # Store enum value
-            }
-        )
-
-    # Check for is_active status change
-    if "is_active" in update_data and update_data["is_active"] != target_user.is_active:
-        audit_log_entries.append(
-            {
-                "changed_by_user_id": current_user.id,
-                "field_name": "is_active",
-                "old_value": target_user.is_active,
-                "new_value": update_data["is_active"],
-            }
-        )
-
-    # Add new audit log entries to the existing ones
-    if audit_log_entries:
-        existing_audit_log = target_user.audit_log
-        for entry_data in audit_log_entries:
-            entry = auth_service.AuditLogEntry(**entry_data)
-            existing_audit_log.append(entry)
-        update_data["audit_log"] = (
-            existing_audit_log  # Ensure the full list is passed for update
-        )
-
-    updated_user = await user_service.update_user(user_id, **update_data)
+    # The service hashes any new password and logs changes to audited fields
+    # (phone number, role, activation status, ...)
+    updated_user = await user_service.update_user(user_id, user_update, current_user.id)
 
     if not updated_user:
         raise HTTPException(
@@ -386,13 +314,13 @@ async def delete_user(
 async def set_user_status(
     user_id: PydanticObjectId,
     is_active: bool,
-    current_user: User = Depends(require_admin_or_super_admin),
+    users: Tuple[User, Optional[UserRoleProj]] = Depends(admin_and_target_role),
 ):
     """
     Activates or deactivates a user (Admin/Super Admin only).
     Admins can only activate/deactivate 'user' or 'general_read_only' roles.
     """
-    target_user = await user_service.get_user_by_id(user_id)
+    current_user, target_user = users
     if not target_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found."
@@ -407,34 +335,20 @@ async def set_user_status(
 
     # Admin role specific restrictions
     if current_user.role == UserRole.ADMIN:
-        if target_user.role in [UserRole.SUPER_ADMIN, UserRole.ADMIN]:
+        if target_user.role in ELEVATED_ROLES:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Admins cannot change the status of 'admin' or 'super_admin' roles.",
             )
-        if target_user.role not in [UserRole.USER, UserRole.GENERAL_READ_ONLY]:
+        if target_user.role not in LOW_PRIV_ROLES:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Admins can only change the status of 'user' or 'general_read_only' roles.",
             )
 
-    # Audit log for status change
-    audit_log_entry = {
-        "changed_by_user_id": current_user.id,
-        "field_name": "is_active",
-        "old_value": target_user.is_active,
-        "new_value": is_active,
-    }
-
-    # Append the new log entry
-    existing_audit_log = target_user.audit_log
-    entry = auth_service.AuditLogEntry(**audit_log_entry)
-    existing_audit_log.append(entry)
-
+    # The status change is recorded in the audit log by the service
     updated_user = await user_service.update_user(
-        user_id,
-        is_active=is_active,
-        audit_log=existing_audit_log,  # Pass the full updated list
+        user_id, UserUpdate(is_active=is_active), current_user.id
     )
 
     if not updated_user:
@@ -450,14 +364,14 @@ async def set_user_status(
 async def set_user_role(
     user_id: PydanticObjectId,
     role: UserRole,  # Expect a UserRole enum
-    current_user: User = Depends(
-        require_super_admin
+    users: Tuple[User, Optional[UserRoleProj]] = Depends(
+        super_admin_and_target_role
     ),  # Only Super Admin can change roles
 ):
     """
     Changes a user's role (Super Admin only).
     """
-    target_user = await user_service.get_user_by_id(user_id)
+    current_user, target_user = users
     if not target_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found."
@@ -478,21 +392,9 @@ async def set_user_role(
             detail="Cannot demote a Super Admin directly. Consider a specific demotion process if needed.",
         )
 
-    # Audit log for role change
-    audit_log_entry = {
-        "changed_by_user_id": current_user.id,
-        "field_name": "role",
-        "old_value": target_user.role.value,  # Store enum value
-        "new_value": role.value,  # Store enum value
-    }
-
-    # Append the new log entry
-    existing_audit_log = target_user.audit_log
-    entry = auth_service.AuditLogEntry(**audit_log_entry)
-    existing_audit_log.append(entry)
-
+    # The role change is recorded in the audit log by the service
     updated_user = await user_service.update_user(
-        user_id, role=role, audit_log=existing_audit_log  # Pass the full updated list
+        user_id, UserUpdate(role=role), current_user.id
     )
 
     if not updated_user:
@@ -507,25 +409,24 @@ async def set_user_role(
 @router.get("/{user_id}/audit-log", response_model=List[AuditLogEntry])
 async def get_user_audit_log(
     user_id: PydanticObjectId,
-    current_user: User = Depends(require_admin_or_super_admin),
+    limit: int = Query(200, ge=1, le=1000),
+    users: Tuple[User, Optional[UserRoleProj]] = Depends(admin_and_target_role),
 ):
     """
-    Retrieves the audit log for a specific user (Admin/Super Admin only).
+    Retrieves the most recent audit log entries for a specific user, newest
+    first (Admin/Super Admin only).
     Admins can only view audit logs for 'user' or 'general_read_only' roles.
     """
-    target_user = await user_service.get_user_by_id(user_id)
+    current_user, target_user = users
     if not target_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found."
         )
 
-    if current_user.role == UserRole.ADMIN and target_user.role not in [
-        UserRole.USER,
-        UserRole.GENERAL_READ_ONLY,
-    ]:
+    if current_user.role == UserRole.ADMIN and target_user.role not in LOW_PRIV_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admins are not authorized to view audit logs for this user's role.",
         )
 
-    return target_user.audit_log
+    return await user_service.get_audit_log(user_id, limit=limit)
@@ -1,8 +1,9 @@
 # app/schemas/hierarchy.py
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from beanie import PydanticObjectId
 from app.models.hierarchy import AdministrativeUnitType
+from app.schemas.misc import ObjectIdStr
 
 
 class AdminUnitBase(BaseModel):
@@ -23,8 +24,14 @@ class AdminUnitUpdate(BaseModel):
 
 
 class AdminUnitPublic(AdminUnitBase):
-    id: PydanticObjectId = Field(..., alias="_id")
+    id: ObjectIdStr = Field(..., alias="_id")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class AdminUnitLite(BaseModel):
+    """Projection of an AdminUnit for hierarchy walks that don't need metadata."""
 
-    class Config:
-        populate_by_name = True
-        json_encoders = {PydanticObjectId: str}
+    id: PydanticObjectId = Field(..., alias="_id")
+    name: str
+    type: AdministrativeUnitType
@@ -1,5 +1,13 @@
 # app/schemas/misc.py
-from pydantic import BaseModel
+from typing import Annotated
+from pydantic import BaseModel, PlainSerializer
+from beanie import PydanticObjectId
+
+# An ObjectId that serializes as its hex string, via pydantic-core rather than
+# the slow per-call `json_encoders` fallback
+ObjectIdStr = Annotated[
+    PydanticObjectId, PlainSerializer(str, return_type=str, when_used="json")
+]
 
 
 class Message(BaseModel):
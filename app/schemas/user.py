@@ -3,19 +3,19 @@ from typing import Optional, List
 from datetime import datetime
 from pydantic import (
     BaseModel,
-    EmailStr,
     Field,
     ConfigDict,
 )
 from beanie import PydanticObjectId
-from app.models.user import UserRole, AuditLogEntry
+from app.models.user import EmailAddress, UserRole
+from app.schemas.misc import ObjectIdStr
 
 
 # --- Base User Schemas ---
 class UserBase(BaseModel):
     first_name: str
     last_name: Optional[str] = None
-    email: EmailStr
+    email: EmailAddress
     phone_number: Optional[str] = None
     role: UserRole
     is_active: Optional[bool] = True
@@ -40,7 +40,7 @@ class UserUpdate(BaseModel):
     # Fields that can be updated. All are optional for updates.
     first_name: Optional[str] = None
     last_name: Optional[str] = None
-    email: Optional[EmailStr] = (
+    email: Optional[EmailAddress] = (
         None  # Email updates might require separate verification flow
     )
     phone_number: Optional[str] = None
@@ -58,22 +58,34 @@ class UserUpdate(BaseModel):
 
 
 class UserPublic(UserBase):
-    # id: str = Field(alias="_id", default_factory=PydanticObjectId)
-    id: str = Field(alias="_id")
+    # Also used as a query projection, so the id is read straight from Mongo's _id
+    id: ObjectIdStr = Field(alias="_id")
     created_at: datetime
     updated_at: datetime
-    audit_log: List[AuditLogEntry] = Field(default_factory=list)
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        populate_by_name=True,
-        json_encoders={PydanticObjectId: str},
-    )
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+
+class UserRoleProj(BaseModel):
+    """Projection of a User with just the fields permission checks look at."""
+
+    id: PydanticObjectId = Field(..., alias="_id")
+    role: UserRole
+    is_active: bool
 
 
 # --- Authentication Schemas ---
+class UserAuthProj(BaseModel):
+    """Projection of a User with just the fields needed to check a login."""
+
+    id: PydanticObjectId = Field(..., alias="_id")
+    email: EmailAddress
+    hashed_password: str
+    is_active: bool
+
+
 class UserLogin(BaseModel):
-    email: EmailStr
+    email: EmailAddress
     password: str
 
 
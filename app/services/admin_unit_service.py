@@ -1,12 +1,28 @@
 # app/services/admin_unit_service.py
-from typing import List, Dict, Optional, Any
+from functools import lru_cache
+from typing import AsyncIterator, List, Dict, Optional, Any, FrozenSet, Iterable
 from beanie import PydanticObjectId
+from bson import ObjectId
+from cachetools import TTLCache
+from app.configs import configs
 from app.models.hierarchy import AdminUnit, AdministrativeUnitType
+from app.schemas.hierarchy import AdminUnitLite, AdminUnitPublic
 
 # from app.models.user import (
 #     User,
 # )  # To check for users in a unit (optional, can be done in route)
 
+# Resolved scopes (a set of root units plus all their descendants), keyed by the
+# frozenset of root unit IDs. Cleared whenever the hierarchy changes. Only used
+# from the event loop, so it needs no lock.
+_scope_cache = TTLCache(
+    maxsize=configs.get("scope_cache", {}).get("maxsize", 1024),
+    ttl=configs.get("scope_cache", {}).get("ttl_seconds", 30),
+)
+
+# The stored fields that make up AdminUnitPublic (_id is included by default)
+_PUBLIC_PROJECTION = {"name": 1, "type": 1, "parent_id": 1, "metadata": 1}
+
 
 class AdminUnitService:
     def __init__(self):
@@ -16,6 +32,16 @@ class AdminUnitService:
         """Fetches all administrative units."""
         return await AdminUnit.find_all().to_list()
 
+    async def iter_all_admin_units_raw(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streams every administrative unit as a raw document holding just the
+        AdminUnitPublic fields, skipping model validation. For large listings
+        that are serialized straight to JSON.
+        """
+        cursor = AdminUnit.get_motor_collection().find({}, _PUBLIC_PROJECTION)
+        async for doc in cursor:
+            yield doc
+
     async def get_admin_unit_by_id(self, unit_id: str) -> Optional[AdminUnit]:
         """Fetches a single administrative unit by its ID."""
         try:
@@ -41,6 +67,7 @@ class AdminUnitService:
             name=name, type=unit_type, parent_id=parent_id, metadata=metadata or {}
         )
         await new_unit.insert()
+        _scope_cache.clear()
         return new_unit
 
     async def update_admin_unit(
@@ -70,6 +97,7 @@ class AdminUnitService:
             update_data["metadata"] = metadata
 
         await unit.set(update_data)
+        _scope_cache.clear()
         return unit
 
     async def delete_admin_unit(self, unit_id: str) -> bool:
@@ -78,43 +106,122 @@ class AdminUnitService:
         if not unit:
             return False
         await unit.delete()
+        _scope_cache.clear()
         return True
 
     async def get_children_units(self, parent_id: str) -> List[AdminUnit]:
         """Fetches immediate children units of a given parent ID."""
         return await AdminUnit.find({"parent_id": parent_id}).to_list()
 
+    async def has_children(self, parent_id: str) -> bool:
+        """Checks whether any unit has the given parent, stopping at the first match."""
+        # A bounded count answers from the (parent_id, type) index without
+        # returning any document
+        count = await AdminUnit.get_motor_collection().count_documents(
+            {"parent_id": parent_id}, limit=1
+        )
+        return count > 0
+
     async def get_descendant_units_ids(self, unit_ids: List[str]) -> List[str]:
         """
         Recursively fetches all descendant unit IDs (including the starting units themselves)
         for a given list of unit IDs. This is crucial for defining the scope of an Admin.
+        Walks the tree one level per query, so the number of round trips is bounded
+        by the hierarchy depth rather than the number of descendants.
         """
         if not unit_ids:
             return []
 
         all_descendants = set(unit_ids)  # Include the starting units themselves
-        queue = list(unit_ids)
-
-        while queue:
-            current_unit_id = queue.pop(0)
-            children = await AdminUnit.find({"parent_id": current_unit_id}).to_list()
+        level = list(all_descendants)
+
+        while level:
+            # parent_id is stored as a string while _id is an ObjectId, so a
+            # $graphLookup can't follow the links; fetch a whole level with $in
+            children = (
+                await AdminUnit.find({"parent_id": {"$in": level}})
+                .project(AdminUnitLite)
+                .to_list()
+            )
+            level = []
             for child in children:
                 child_id_str = str(child.id)
                 if child_id_str not in all_descendants:
                     all_descendants.add(child_id_str)
-                    queue.append(child_id_str)
+                    level.append(child_id_str)
 
         return list(all_descendants)
 
+    async def get_scope_unit_ids(self, unit_ids: Iterable[str]) -> FrozenSet[str]:
+        """
+        Returns the IDs of the given units and all their descendants, reusing a
+        recently computed result for the same set of units.
+        """
+        key = frozenset(unit_ids)
+        scope = _scope_cache.get(key)
+        if scope is None:
+            scope = frozenset(await self.get_descendant_units_ids(list(key)))
+            _scope_cache[key] = scope
+        return scope
+
+    async def get_scope_units_public(
+        self, unit_ids: List[str]
+    ) -> List[AdminUnitPublic]:
+        """
+        Fetches the given units and all their descendants, already shaped as
+        AdminUnitPublic. Walks the tree one level per query, so the number of
+        round trips is bounded by the hierarchy depth rather than the unit count.
+        """
+        # Malformed IDs can't match any unit, so skip them. Plain bson ObjectIds
+        # are enough for a raw $in filter (no pydantic validation per ID)
+        root_ids = [ObjectId(uid) for uid in unit_ids if ObjectId.is_valid(uid)]
+        level = (
+            await AdminUnit.find({"_id": {"$in": root_ids}})
+            .project(AdminUnitPublic)
+            .to_list()
+        )
+
+        units = {}
+        while level:
+            for unit in level:
+                units[str(unit.id)] = unit
+            # parent_id is stored as a string, so match children on string IDs
+            parent_ids = [str(unit.id) for unit in level]
+            level = [
+                child
+                for child in await AdminUnit.find({"parent_id": {"$in": parent_ids}})
+                .project(AdminUnitPublic)
+                .to_list()
+                if str(child.id) not in units
+            ]
+
+        _scope_cache[frozenset(unit_ids)] = frozenset(units) | frozenset(unit_ids)
+        return list(units.values())
+
     async def get_ancestor_units_ids(self, unit_id: str) -> List[str]:
         """
         Recursively fetches all ancestor unit IDs for a given unit ID, up to the root.
+        Each hop reads only the parent_id of the next unit, as a raw document.
         """
+        collection = AdminUnit.get_motor_collection()
         ancestors = []
-        current_unit = await self.get_admin_unit_by_id(unit_id)
-        while current_unit and current_unit.parent_id:
-            ancestors.append(str(current_unit.parent_id))
-            current_unit = await self.get_admin_unit_by_id(str(current_unit.parent_id))
+        seen = {unit_id}
+        current_id = unit_id
+        while ObjectId.is_valid(current_id):
+            doc = await collection.find_one(
+                {"_id": ObjectId(current_id)}, {"parent_id": 1, "_id": 0}
+            )
+            current_id = doc.get("parent_id") if doc else None
+            if not current_id or current_id in seen:  # root reached (or a cycle)
+                break
+            seen.add(current_id)
+            ancestors.append(current_id)
         return ancestors[
             ::-1
         ]  # Return in order from highest ancestor to immediate parent
+
+
+@lru_cache(maxsize=1)
+def get_admin_unit_service() -> AdminUnitService:
+    """Returns the process-wide AdminUnitService instance."""
+    return AdminUnitService()
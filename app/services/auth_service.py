@@ -1,62 +1,240 @@
 # app/services/auth_service.py
-from datetime import datetime, timedelta, timezone
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from datetime import timedelta
 from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from cachetools import TTLCache
+import bcrypt
+import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from jwt import InvalidTokenError as JWTError
 from fastapi import HTTPException, status
 from app.configs import env, configs
 
-access_token_expire_minutes = configs.get("jwt").get("access_token_expire_minutes")
-algorithm = configs.get("jwt").get("algorithm")
+# Read and coerced once; a missing key fails here rather than on the first login
+_jwt_cfg = configs["jwt"]
+access_token_expire_minutes = int(_jwt_cfg["access_token_expire_minutes"])
+algorithm = str(_jwt_cfg["algorithm"])
 secret_key = env.get("SECRET_KEY")
+if not secret_key:
+    raise RuntimeError("SECRET_KEY is not set; it is required to sign access tokens")
+# Encoded once so the key isn't re-encoded on every encode/decode
+_KEY_BYTES = secret_key.encode()
+_ACCESS_TTL_SEC = access_token_expire_minutes * 60
+# New passwords are hashed with Argon2id. The defaults (19 MiB, 2 passes, 1 lane)
+# are OWASP's baseline for interactive logins; memory_cost_kib is per concurrent
+# hash, so keep it well within the container's memory budget.
+_argon2_cfg = configs.get("argon2", {})
+_password_hasher = PasswordHasher(
+    time_cost=int(_argon2_cfg.get("time_cost", 2)),
+    memory_cost=int(_argon2_cfg.get("memory_cost_kib", 19456)),
+    parallelism=int(_argon2_cfg.get("parallelism", 1)),
+    hash_len=32,
+    salt_len=16,
+)
+ARGON2_PREFIX = "$argon2"
+
+# Dedicated threads for the async hashing variants, so hashes never queue behind
+# other blocking work in the default executor, and at most `max_concurrent` of
+# them (each holding memory_cost_kib of RAM) run at once
+_hash_executor = ThreadPoolExecutor(
+    max_workers=int(_argon2_cfg.get("max_concurrent") or os.cpu_count() or 4),
+    thread_name_prefix="password-hash",
+)
+
+# Older hashes are bcrypt. Those marked with this prefix had their input
+# pre-hashed with SHA-256 (see _prep); unmarked ones were made from the raw
+# password. Both are still verified, and upgraded to Argon2id on the next login.
+PREHASH_PREFIX = "$sha256"
+
+# Verified token payloads, keyed by a 128-bit BLAKE2b digest of the raw token. Entries live for at
+# most `decode_cache_ttl_seconds`, and the token's own `exp` is re-checked on hit.
+_jwt_cache = TTLCache(
+    maxsize=_jwt_cfg.get("decode_cache_maxsize", 10000),
+    ttl=_jwt_cfg.get("decode_cache_ttl_seconds", 30),
+)
+_jwt_cache_lock = threading.Lock()
+
+# Recently verified logins: HMAC(secret, email + password) -> the stored hash that
+# matched. Repeat logins from the same client skip hashing for up to `ttl_seconds`.
+# Only successes are cached, and a hit counts only while the user's stored hash is
+# unchanged, so a password change takes effect immediately. Deactivation is still
+# checked by the caller on every login.
+_login_cache = TTLCache(
+    maxsize=configs.get("login_cache", {}).get("maxsize", 1000),
+    ttl=configs.get("login_cache", {}).get("ttl_seconds", 60),
+)
+# Recently failed logins, keyed the same way and holding the hash the attempt was
+# checked against (the dummy hash for unknown emails). A repeated wrong password is
+# rejected without hashing again, for known and unknown emails alike so
+# the response time still doesn't reveal which emails exist.
+_failed_login_cache = TTLCache(
+    maxsize=configs.get("login_cache", {}).get("failed_maxsize", 10000),
+    ttl=min(configs.get("login_cache", {}).get("failed_ttl_seconds", 60), 60),
+)
+_login_cache_lock = threading.Lock()
+
+
+def _prep(password: str) -> bytes:
+    """
+    Pre-hashes a password to a fixed 44-byte input, as legacy bcrypt hashes
+    were made (bcrypt silently truncates at 72 bytes and stops at a NUL byte).
+    """
+    return base64.b64encode(hashlib.sha256(password.encode()).digest())
+
+
+def _login_key(email: str, password: str) -> bytes:
+    """Keys the login cache without keeping plain passwords in memory."""
+    return hmac.new(
+        _KEY_BYTES, f"{email}\0{password}".encode(), hashlib.sha256
+    ).digest()
+
+
+# Checked against when a login names an unknown user, so that response takes as
+# long as a wrong password and doesn't reveal which emails are registered
+_DUMMY_HASH = _password_hasher.hash("x" * 8)
 
 
 class AuthService:
     def __init__(self):
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        pass
         # REMOVE THIS LINE: self.user_service = UserService() # No UserService here
 
     def hash_password(self, password: str) -> str:
-        """Hashes a plain text password."""
-        return self.pwd_context.hash(password)
+        """Hashes a plain text password (Argon2id)."""
+        return _password_hasher.hash(password)
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        """Verifies a plain text password against a hashed password."""
-        return self.pwd_context.verify(plain_password, hashed_password)
+        """Verifies a plain text password against an Argon2id or legacy bcrypt hash."""
+        try:
+            if hashed_password.startswith(ARGON2_PREFIX):
+                return _password_hasher.verify(hashed_password, plain_password)
+            if hashed_password.startswith(PREHASH_PREFIX):
+                return bcrypt.checkpw(
+                    _prep(plain_password),
+                    hashed_password[len(PREHASH_PREFIX) :].encode(),
+                )
+            # Legacy hash made from the raw password
+            return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+        except (VerificationError, InvalidHashError, ValueError):
+            # Wrong password, or not a hash we recognize
+            return False
+
+    def verify_login(self, email: str, plain_password: str, user) -> bool:
+        """
+        Verifies a login attempt for a user that may not exist. A hash check
+        runs against a dummy hash when `user` is None, so both failure cases
+        take the same time. Results are cached briefly: successes so repeat
+        logins skip hashing, failures so repeated wrong guesses do too.
+        """
+        hashed_password = user.hashed_password if user else _DUMMY_HASH
+        key = _login_key(email, plain_password)
+        with _login_cache_lock:
+            cached_ok = _login_cache.get(key) if user else None
+            cached_failed = _failed_login_cache.get(key)
+        # Cached results only count while the stored hash is unchanged
+        if cached_ok is not None and hmac.compare_digest(cached_ok, hashed_password):
+            return True
+        if cached_failed is not None and hmac.compare_digest(
+            cached_failed, hashed_password
+        ):
+            return False
+
+        password_ok = self.verify_password(plain_password, hashed_password)
+        with _login_cache_lock:
+            if user is not None and password_ok:
+                _login_cache[key] = hashed_password
+                _failed_login_cache.pop(key, None)
+                return True
+            _failed_login_cache[key] = hashed_password
+        return False
+
+    # Password hashing deliberately takes milliseconds to tens of milliseconds
+    # per call, so async callers run it on _hash_executor instead of blocking
+    # the event loop. Argon2 and bcrypt both release the GIL while hashing.
+
+    async def hash_password_async(self, password: str) -> str:
+        """Async variant of `hash_password`."""
+        return await asyncio.get_running_loop().run_in_executor(
+            _hash_executor, self.hash_password, password
+        )
+
+    async def verify_password_async(
+        self, plain_password: str, hashed_password: str
+    ) -> bool:
+        """Async variant of `verify_password`."""
+        return await asyncio.get_running_loop().run_in_executor(
+            _hash_executor, self.verify_password, plain_password, hashed_password
+        )
+
+    async def verify_login_async(self, email: str, plain_password: str, user) -> bool:
+        """Async variant of `verify_login`."""
+        return await asyncio.get_running_loop().run_in_executor(
+            _hash_executor, self.verify_login, email, plain_password, user
+        )
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """
+        Returns True if a stored hash is a legacy bcrypt hash or an Argon2id hash
+        made with different parameters than the ones currently configured.
+        """
+        if not hashed_password.startswith(ARGON2_PREFIX):
+            return True
+        return _password_hasher.check_needs_rehash(hashed_password)
 
     def create_access_token(
-        self, data: dict, expires_delta: Optional[timedelta] = None
+        self,
+        sub: str,
+        expires_delta: Optional[timedelta] = None,
+        extra: Optional[dict] = None,
     ) -> str:
         """
         Creates a JWT access token.
         Args:
-            data (dict): The payload to encode in the token (e.g., {"sub": user_email}).
+            sub (str): The token subject (the user's email).
             expires_delta (Optional[timedelta]): Optional timedelta for token expiration.
                                                  If None, uses default from settings.
+            extra (Optional[dict]): Additional claims to include in the payload.
         Returns:
             str: The encoded JWT token.
         """
-        to_encode = data.copy()
-        if expires_delta:
-            expire = datetime.now(timezone.utc) + expires_delta  # Use timezone.utc
+        # JWT "exp" is an integer epoch, so skip building datetime objects
+        ttl = int(expires_delta.total_seconds()) if expires_delta else _ACCESS_TTL_SEC
+        exp = int(time.time()) + ttl
+        if extra:
+            payload = {**extra, "sub": sub, "exp": exp}
         else:
-            expire = datetime.now(timezone.utc) + timedelta(
-                minutes=access_token_expire_minutes
-            )
-        to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(to_encode, secret_key, algorithm=algorithm)
-        return encoded_jwt
+            payload = {"sub": sub, "exp": exp}
+        return jwt.encode(payload, _KEY_BYTES, algorithm=algorithm)
 
     def decode_access_token(self, token: str) -> dict:
         """
         Decodes and validates a JWT access token.
         Raises HTTPException if the token is invalid or expired.
         This method should only handle token decoding and basic JWT validation.
+        Successfully verified payloads are cached briefly so repeat requests with
+        the same token skip signature verification.
         """
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        with _jwt_cache_lock:
+            payload = _jwt_cache.get(key)
+        if payload is not None and payload.get("exp", 0) > time.time():
+            return payload
+
         try:
-            payload = jwt.decode(token, secret_key, algorithms=[algorithm])
+            payload = jwt.decode(token, _KEY_BYTES, algorithms=[algorithm])
             # You might want to add a check for 'sub' in payload here,
             # but leave the user lookup to get_current_user.
+            with _jwt_cache_lock:
+                _jwt_cache[key] = payload
             return payload
         except JWTError:
             raise HTTPException(
@@ -70,3 +248,9 @@ class AuthService:
                 detail="Invalid token format",
                 headers={"WWW-Authenticate": "Bearer"},
             )
+
+
+@lru_cache(maxsize=1)
+def get_auth_service() -> AuthService:
+    """Returns the process-wide AuthService instance."""
+    return AuthService()
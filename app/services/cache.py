@@ -0,0 +1,112 @@
+# app/services/cache.py
+# Optional Redis cache shared by all workers. It is enabled when REDIS_URL is set
+# and the `redis` package is installed (pip install redis); otherwise reads always
+# miss and writes are no-ops, so callers never need to check. Like the Mongo
+# client in db.py, the client is created once in main.py's lifespan handler and
+# registered here.
+import logging
+from typing import Optional, Tuple
+
+from app.configs import env, configs
+
+try:
+    import redis.asyncio as redis
+except ImportError:  # optional dependency
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# Entries expire on their own even if an invalidation is missed
+DEFAULT_TTL_SECONDS = int(configs.get("redis_cache", {}).get("ttl_seconds", 300))
+
+redis_client: Optional["redis.Redis"] = None
+
+
+def create_redis_client() -> Optional["redis.Redis"]:
+    """Creates the Redis client, or returns None if Redis is not configured."""
+    url = env.get("REDIS_URL")
+    if not url:
+        return None
+    if redis is None:
+        logger.warning("REDIS_URL is set but the redis package is not installed")
+        return None
+    return redis.from_url(url)
+
+
+# A cache outage must not fail requests: errors are logged and treated as misses
+
+
+async def cache_get(key: str) -> Optional[bytes]:
+    """Returns the cached bytes for `key`, or None on a miss."""
+    if redis_client is None:
+        return None
+    try:
+        return await redis_client.get(key)
+    except redis.RedisError as e:
+        logger.warning(f"Redis GET {key} failed: {e}")
+        return None
+
+
+async def cache_set(key: str, value: bytes, ttl: int = DEFAULT_TTL_SECONDS) -> None:
+    """Stores `value` under `key` for `ttl` seconds."""
+    if redis_client is None:
+        return
+    try:
+        await redis_client.set(key, value, ex=ttl)
+    except redis.RedisError as e:
+        logger.warning(f"Redis SET {key} failed: {e}")
+
+
+# Versioned entries, for read-through caches of data that is invalidated on
+# writes. A reader fetches the key's version before reading the database and
+# tags what it caches with it; cache_invalidate bumps the version, so an entry
+# cached from a read that raced with a write never matches again and a stale
+# value can't be re-cached after an invalidation.
+
+
+def _version_key(key: str) -> str:
+    return f"{key}:version"
+
+
+async def cache_get_versioned(key: str) -> Tuple[Optional[bytes], bytes]:
+    """
+    Returns (value, version) for `key`: the cached bytes, or None on a miss or
+    when the entry predates the last invalidation, and the version to pass to
+    cache_set_versioned when re-caching it.
+    """
+    if redis_client is None:
+        return None, b"0"
+    try:
+        value, version = await redis_client.mget(key, _version_key(key))
+    except redis.RedisError as e:
+        logger.warning(f"Redis MGET {key} failed: {e}")
+        return None, b"0"
+    version = version or b"0"
+    if value is not None:
+        tag, _, data = value.partition(b"|")
+        if tag == version:
+            return data, version
+    return None, version
+
+
+async def cache_set_versioned(
+    key: str, value: bytes, version: bytes, ttl: int = DEFAULT_TTL_SECONDS
+) -> None:
+    """Stores `value` under `key`, tagged with the version read before loading it."""
+    await cache_set(key, version + b"|" + value, ttl)
+
+
+async def cache_invalidate(*keys: str, ttl: int = DEFAULT_TTL_SECONDS) -> None:
+    """Removes `keys` and bumps their versions, in one round trip."""
+    if redis_client is None or not keys:
+        return
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.incr(_version_key(key))
+                # Outlives any entry tagged with an older version
+                pipe.expire(_version_key(key), 2 * ttl)
+            pipe.delete(*keys)
+            await pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Redis invalidation failed: {e}")
@@ -1,6 +1,7 @@
 # app/services/db.py
-# This file can be used for centralized database client access if needed
-# For now, `main.py` handles Beanie initialization.
+# Centralized MongoDB client access. `main.py` creates the client once in its
+# lifespan handler and registers it here, so everything shares one pool.
+from datetime import timezone
 from pymongo import AsyncMongoClient
 from typing import Optional
 from app.configs import env
@@ -10,9 +11,31 @@ from app.configs import env
 db_client: Optional[AsyncMongoClient] = None
 
 
+def create_mongo_client() -> AsyncMongoClient:
+    """
+    Creates the MongoDB async client with an explicitly sized connection pool.
+    MONGO_POOL_MAX / MONGO_POOL_MIN should match the worker's expected concurrency.
+    MONGO_COMPRESSORS optionally enables wire compression, e.g. "zstd,zlib"
+    (zstd and snappy need the zstandard / python-snappy packages; zlib is built in).
+    Datetimes are decoded as aware UTC values, matching what utc_now() writes.
+    """
+    return AsyncMongoClient(
+        env.get("MONGO_URI"),
+        maxPoolSize=int(env.get("MONGO_POOL_MAX") or 20),
+        minPoolSize=int(env.get("MONGO_POOL_MIN") or 5),
+        serverSelectionTimeoutMS=3000,
+        uuidRepresentation="standard",
+        tz_aware=True,
+        tzinfo=timezone.utc,
+        compressors=env.get("MONGO_COMPRESSORS") or None,
+    )
+
+
 async def get_database_client() -> AsyncMongoClient:
-    """Returns the MongoDB async client."""
-    global db_client
+    """
+    Returns the MongoDB async client created at startup. It is never created
+    here, so concurrent first callers can't each open their own pool.
+    """
     if db_client is None:
-        db_client = AsyncMongoClient(env.get("MONGO_URI"))
+        raise RuntimeError("MongoDB client is not initialized; the app has not started")
     return db_client
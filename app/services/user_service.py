@@ -1,39 +1,113 @@
 # app/services/user_service.py
-from typing import List, Optional, Union
+import asyncio
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from fastapi import HTTPException, status
-from beanie import PydanticObjectId
-from datetime import datetime
+from beanie import PydanticObjectId, UpdateResponse
+from cachetools import TTLCache
+import orjson
+from pymongo.errors import DuplicateKeyError
 
-from app.models.user import User, AuditLogEntry
-from app.schemas.user import UserUpdate, ProfileUpdate, UserCreate
-from app.auth.auth import AuthService
+from app.configs import configs
+from app.models.user import User, UserRole, AuditLogEntry, utc_now
+from app.schemas.user import (
+    UserUpdate,
+    ProfileUpdate,
+    UserCreate,
+    UserAuthProj,
+    UserPublic,
+    UserRoleProj,
+)
+from app.services.auth_service import get_auth_service
+from app.services.cache import (
+    cache_get_versioned,
+    cache_invalidate,
+    cache_set_versioned,
+)
+
+# Recently loaded users keyed by email, so authenticated requests can skip the
+# database round-trip. Entries are evicted whenever the user is updated or deleted.
+_user_cache = TTLCache(
+    maxsize=configs.get("user_cache", {}).get("maxsize", 5000),
+    ttl=configs.get("user_cache", {}).get("ttl_seconds", 60),
+)
+# Bumped on every invalidation, so a load that started before one doesn't
+# re-cache what it read
+_user_cache_generation = 0
+
+
+# Profile fields whose changes are recorded in the audit log, in the order the
+# entries for one update are written (a tuple, so that order is stable)
+AUDITED_FIELDS = (
+    "email",
+    "phone_number",
+    "first_name",
+    "last_name",
+    "profile_picture_url",
+    "role",
+    "is_active",
+)
+
+
+def _user_id_key(user_id: Any) -> str:
+    return f"user:id:{user_id}"
+
+
+def _user_email_key(email: str) -> str:
+    return f"user:email:{email}"
+
+
+def _user_cache_entry(user: User) -> bytes:
+    """Serializes a user for the Redis cache; password hashes are never cached."""
+    return user.model_dump_json(exclude={"hashed_password"}).encode()
+
+
+def _user_from_cache(data: bytes) -> User:
+    """
+    Rebuilds a User from its cache entry. The hash is left empty, so code that
+    needs it must load it with get_user_by_email_for_auth.
+    """
+    return User.model_validate({**orjson.loads(data), "hashed_password": ""})
+
+
+def _audit_value(value: Any) -> Any:
+    """Stores enums (e.g. roles) in the audit log by their plain value."""
+    return value.value if isinstance(value, Enum) else value
+
+
+def _audited_changes(user: User, update_data: dict) -> List[Tuple[str, Any, Any]]:
+    """
+    Diffs `update_data` against `user` over AUDITED_FIELDS, returning
+    (field_name, old_value, new_value) for each field the update actually changes,
+    in AUDITED_FIELDS order. Only the audited fields present in the update are
+    diffed, so updates that touch none (e.g. a password reset) skip the diff.
+    """
+    return [
+        (field_name, old_value, new_value)
+        for field_name in AUDITED_FIELDS
+        if field_name in update_data
+        and (old_value := getattr(user, field_name))
+        != (new_value := update_data[field_name])
+    ]
 
 
 class UserService:
     def __init__(self):
         # Initialize AuthService to hash passwords
-        self.auth_service = AuthService()
-
-    def _handle_id(self, user: User):
-        user.id = str(user.id)
-        return user
+        self.auth_service = get_auth_service()
 
     async def create_user(self, user_create_data: UserCreate) -> Optional[User]:
         """
         Creates a new user in the database.
         Hashes the password and converts UserCreate schema to Beanie User Document.
+        Raises 409 if a user with this email already exists (enforced by the
+        unique email index, so there is no separate lookup to race against).
         """
-        # First, check if a user with this email already exists
-        existing_user = await self.get_user_by_email(user_create_data.email)
-        if existing_user:
-            # Raising HTTPException from service is fine if it's a domain-level error
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="User with this email already exists.",
-            )
-
         # Hash the plaintext password from UserCreate
-        hashed_password = self.auth_service.hash_password(user_create_data.password)
+        hashed_password = await self.auth_service.hash_password_async(
+            user_create_data.password
+        )
 
         user_data_dict = user_create_data.model_dump(
             exclude={"password"}, exclude_none=True
@@ -46,8 +120,13 @@ class UserService:
 
         try:
             await new_user.insert()  # Now call insert() on the Beanie User Document
-            new_user = self._handle_id(new_user)
             return new_user
+        except DuplicateKeyError:
+            # Raising HTTPException from service is fine if it's a domain-level error
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="User with this email already exists.",
+            )
         except Exception as e:
             # Log the error for debugging
             print(f"Error creating user: {e}")
@@ -58,18 +137,113 @@ class UserService:
             )
 
     async def get_user_by_id(self, user_id: PydanticObjectId) -> Optional[User]:
-        """Retrieves a user by their ID."""
-        return await User.get(user_id)
+        """Retrieves a user by their ID, reading through the shared Redis cache."""
+        key = _user_id_key(user_id)
+        cached, version = await cache_get_versioned(key)
+        if cached is not None:
+            return _user_from_cache(cached)
+        user = await User.get(user_id)
+        if user is not None:
+            await cache_set_versioned(key, _user_cache_entry(user), version)
+        return user
+
+    async def get_users_by_ids(
+        self, user_ids: Iterable[PydanticObjectId]
+    ) -> Dict[PydanticObjectId, User]:
+        """
+        Retrieves several users in one query, keyed by ID (missing IDs are simply
+        absent). Use this instead of calling get_user_by_id in a loop.
+        """
+        ids = list(set(user_ids))
+        if not ids:
+            return {}
+        users = await User.find({"_id": {"$in": ids}}).to_list()
+        return {user.id: user for user in users}
 
     async def get_user_by_email(self, email: str) -> Optional[User]:
-        """Retrieves a user by their email address."""
-        return await User.find_one(User.email == email)
+        """Retrieves a user by their email, reading through the shared Redis cache."""
+        key = _user_email_key(email)
+        cached, version = await cache_get_versioned(key)
+        if cached is not None:
+            return _user_from_cache(cached)
+        user = await User.find_one(User.email == email)
+        if user is not None:
+            await cache_set_versioned(key, _user_cache_entry(user), version)
+        return user
 
-    async def get_all_users(self, limit: int = 100, skip: int = 0) -> List[User]:
-        """Retrieves all users with pagination."""
-        all_users = await User.find_all(limit=limit, skip=skip).to_list()
+    async def get_user_role_and_status(
+        self, user_id: PydanticObjectId
+    ) -> Optional[UserRoleProj]:
+        """Retrieves only a user's role and active flag, for permission checks."""
+        # Entries cached before the user's last update never match, so the role
+        # and status read here are never older than the last invalidation
+        cached, _ = await cache_get_versioned(_user_id_key(user_id))
+        if cached is not None:
+            # Pick the two fields out of the cached JSON rather than validating
+            # a whole User just to read them
+            data = orjson.loads(cached)
+            return UserRoleProj.model_construct(
+                id=user_id, role=UserRole(data["role"]), is_active=data["is_active"]
+            )
+        return await User.find_one(User.id == user_id).project(UserRoleProj)
+
+    async def get_user_by_email_for_auth(self, email: str) -> Optional[UserAuthProj]:
+        """Retrieves only the fields needed to verify a login for this email."""
+        return await User.find_one(User.email == email).project(UserAuthProj)
 
-        return [self._handle_id(user) for user in all_users]
+    async def get_cached_user_by_email(self, email: str) -> Optional[User]:
+        """Retrieves a user by email, serving recently loaded users from memory."""
+        user = _user_cache.get(email)
+        if user is None:
+            generation = _user_cache_generation
+            user = await self.get_user_by_email(email)
+            # Skip caching if a user was invalidated while this one was loading
+            if user is not None and generation == _user_cache_generation:
+                _user_cache[email] = user
+        return user
+
+    async def invalidate_cached_user(self, user_id: Any, *emails: str) -> None:
+        """Drops a changed user from the in-memory and Redis caches."""
+        global _user_cache_generation
+        _user_cache_generation += 1
+        for email in emails:
+            _user_cache.pop(email, None)
+        await cache_invalidate(
+            _user_id_key(user_id), *(_user_email_key(email) for email in emails)
+        )
+
+    async def set_password_hash(
+        self, user: Union[User, UserAuthProj], hashed_password: str
+    ) -> None:
+        """Stores a new password hash for the user, e.g. after an upgrade on login."""
+        await User.find_one(User.id == user.id).update(
+            {"$set": {"hashed_password": hashed_password, "updated_at": utc_now()}}
+        )
+        user.hashed_password = hashed_password
+        await self.invalidate_cached_user(user.id, user.email)
+
+    async def get_all_users(
+        self,
+        limit: int = 100,
+        skip: int = 0,
+        role_in: Optional[Iterable[UserRole]] = None,
+        after_id: Optional[PydanticObjectId] = None,
+    ) -> List[UserPublic]:
+        """
+        Retrieves users in _id order, optionally only those whose role is in
+        `role_in` (filtered by the database, not in Python). Only the public
+        fields are fetched, decoded straight into UserPublic.
+        Pages with keyset pagination: pass the last ID of the previous page as
+        `after_id`, which seeks straight to the next page via the index. `skip`
+        is deprecated, since the server still walks every skipped document.
+        """
+        filters = {}
+        if role_in:
+            filters["role"] = {"$in": [role.value for role in role_in]}
+        if after_id is not None:
+            filters["_id"] = {"$gt": after_id}
+        query = User.find(filters, limit=limit, skip=skip).sort("+_id")
+        return await query.project(UserPublic).to_list()
 
     async def update_user(
         self,
@@ -80,65 +254,101 @@ class UserService:
         """
         Updates an existing user's data and logs changes to contact information.
         changer_user_id: The ID of the user who is performing this update.
+        Raises 409 if the new email already belongs to another user.
         """
-        user = await self.get_user_by_id(user_id)
-        if not user:
-            return None
-
-        # Prepare data for update, excluding fields not meant for direct update or handled specially
-        update_data = user_update.model_dump(exclude_unset=True)
+        # Prepare data for update: only the fields the client actually sent. The
+        # schemas are flat, so reading them directly matches
+        # model_dump(exclude_unset=True) without a serializer pass
+        update_data = {
+            field: getattr(user_update, field) for field in user_update.model_fields_set
+        }
+        # Nothing to change (e.g. an empty form re-post): skip the write and the
+        # audit entirely and just return the user as it is
+        if not update_data:
+            return await self.get_user_by_id(user_id)
 
         # Special handling for password hashing if provided
         if "password" in update_data and update_data["password"]:
-            from app.services.auth_service import (
-                AuthService,
-            )  # Import locally to avoid circular dependency
+            update_data["hashed_password"] = (
+                await self.auth_service.hash_password_async(update_data.pop("password"))
+            )
 
-            auth_service = AuthService()
-            update_data["hashed_password"] = auth_service.hash_password(
-                update_data.pop("password")
+        # Apply the update and get the previous version back in a single round trip
+        # (findAndModify); its values feed the audit log. $set bypasses the model's
+        # save hooks, so stamp updated_at here.
+        update_data["updated_at"] = utc_now()
+        try:
+            old_user = await User.find_one(User.id == user_id).update(
+                {"$set": update_data}, response_type=UpdateResponse.OLD_DOCUMENT
+            )
+        except DuplicateKeyError:
+            # The new email is already taken (unique email index)
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="User with this email already exists.",
             )
+        if not old_user:
+            return None
 
-        # --- Audit Logging for Contact Information Changes ---
-        audit_entries = []
-        fields_to_audit = [
-            "email",
-            "phone_number",
-            "first_name",
-            "last_name",
-            "profile_picture_url",
+        # --- Audit Logging for Profile Changes ---
+        # Written as plain documents in AuditLogEntry's shape, skipping model
+        # validation on the write path (they are validated when read back)
+        audit_entries = [
+            {
+                "user_id": user_id,
+                "changed_by_user_id": changer_user_id,
+                "timestamp": update_data["updated_at"],
+                "field_name": field_name,
+                "old_value": _audit_value(old_value),
+                "new_value": _audit_value(new_value),
+            }
+            for field_name, old_value, new_value in _audited_changes(
+                old_user, update_data
+            )
         ]
-
-        for field_name in fields_to_audit:
-            if (
-                field_name in update_data
-                and getattr(user, field_name) != update_data[field_name]
-            ):
-                audit_entries.append(
-                    AuditLogEntry(
-                        changed_by_user_id=changer_user_id,
-                        timestamp=datetime.utcnow(),
-                        field_name=field_name,
-                        old_value=getattr(user, field_name),
-                        new_value=update_data[field_name],
-                    )
-                )
-
-        # Apply updates to the user document
-        await user.set(update_data)
-
-        # Append audit entries to the user's audit_log
         if audit_entries:
-            # Use append operation to add to list without overwriting
-            # $each allows adding multiple elements to the array
-            await user.update({"$push": {"audit_log": {"$each": audit_entries}}})
+            await AuditLogEntry.get_motor_collection().insert_many(audit_entries)
 
-        return self._handle_id(user)
+        # Password, role or status may have changed, so never serve the stale copy again
+        user = old_user.model_copy(update=update_data)
+        await self.invalidate_cached_user(user_id, old_user.email, user.email)
+
+        return user
+
+    async def get_audit_log(
+        self, user_id: PydanticObjectId, limit: int = 200
+    ) -> List[AuditLogEntry]:
+        """
+        Retrieves a user's most recent `limit` audit entries, newest first. The
+        (user_id, timestamp) index serves this in order, so only those entries
+        are read however long the user's history grows.
+        """
+        return (
+            await AuditLogEntry.find(AuditLogEntry.user_id == user_id)
+            .sort(-AuditLogEntry.timestamp)
+            .limit(limit)
+            .to_list()
+        )
 
     async def delete_user(self, user_id: PydanticObjectId) -> bool:
-        """Deletes a user by their ID."""
-        user = await self.get_user_by_id(user_id)
-        if not user:
+        """
+        Deletes a user by their ID, along with their audit log entries (the
+        history can only be read through the user, so it would be unreachable).
+        """
+        # One round trip: delete and get back just the email needed to evict caches
+        deleted = await User.get_motor_collection().find_one_and_delete(
+            {"_id": user_id}, projection={"email": 1}
+        )
+        if not deleted:
             return False
-        await user.delete()
+        await asyncio.gather(
+            AuditLogEntry.get_motor_collection().delete_many({"user_id": user_id}),
+            self.invalidate_cached_user(user_id, deleted["email"]),
+        )
         return True
+
+
+@lru_cache(maxsize=1)
+def get_user_service() -> UserService:
+    """Returns the process-wide UserService instance."""
+    return UserService()
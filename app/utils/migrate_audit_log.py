@@ -0,0 +1,61 @@
+# app/utils/migrate_audit_log.py
+"""
+One-off migration for databases created before audit entries moved out of the
+User document: copies each user's embedded `audit_log` entries into the
+`audit_log` collection (tagged with the user's ID), then removes the array.
+
+Run once against the configured database:
+
+    python -m app.utils.migrate_audit_log
+
+Safe to re-run: entries are upserted by their full contents, so a run that
+stopped between copying a user's entries and unsetting the array doesn't
+duplicate them the next time.
+"""
+import asyncio
+import logging
+
+from pymongo import ReplaceOne
+
+from app.configs import env
+from app.services import db
+
+logger = logging.getLogger(__name__)
+
+
+async def migrate_embedded_audit_logs(database) -> int:
+    """
+    Moves every embedded User.audit_log array into the audit_log collection.
+    Returns the number of entries copied.
+    """
+    users = database["users"]
+    audit_log = database["audit_log"]
+    copied = 0
+    async for user in users.find(
+        {"audit_log": {"$exists": True}}, projection={"audit_log": 1}
+    ):
+        entries = [
+            {**entry, "user_id": user["_id"]} for entry in user["audit_log"] or []
+        ]
+        if entries:
+            await audit_log.bulk_write(
+                [ReplaceOne(entry, entry, upsert=True) for entry in entries],
+                ordered=False,
+            )
+            copied += len(entries)
+        await users.update_one({"_id": user["_id"]}, {"$unset": {"audit_log": ""}})
+    return copied
+
+
+async def main() -> None:
+    client = db.create_mongo_client()
+    try:
+        copied = await migrate_embedded_audit_logs(client[env.get("MONGO_DB")])
+        logger.info(f"Moved {copied} embedded audit log entries to audit_log")
+    finally:
+        await client.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
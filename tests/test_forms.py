@@ -0,0 +1,50 @@
+# tests/test_forms.py
+import pyarrow as pa
+
+from app.google.forms import GoogleFormsReader, _extract_dates, _format_date
+
+
+def _reader_without_api(responses: list) -> GoogleFormsReader:
+    """A reader over a fixed list of raw responses, with no credentials or API calls."""
+    reader = GoogleFormsReader.__new__(GoogleFormsReader)
+    reader.form_id = "form"
+    reader._form_definition = {"items": []}
+    reader._question_id_to_title_map = {}
+    reader.iter_raw_responses = lambda page_size=1000: iter(responses)
+    return reader
+
+
+def test_get_responses_arrow_accepts_nanosecond_create_times():
+    """createTime may carry 9 fractional digits, which a microsecond cast rejects."""
+    reader = _reader_without_api(
+        [
+            {"responseId": "a", "createTime": "2024-05-01T10:00:00.123456789Z"},
+            {"responseId": "b", "createTime": "2024-05-01T10:00:00Z"},
+        ]
+    )
+
+    table = reader.get_responses_arrow(map_columns_to_titles=False)
+
+    submit_time = table.column("submit_time")
+    assert submit_time.type == pa.timestamp("ns", tz="UTC")
+    assert submit_time[0].value == 1714557600123456789
+    assert submit_time[1].value == 1714557600000000000
+
+
+def _baseline_format_date(ans: dict) -> str:
+    """The original inline date formatting, kept as the reference output."""
+    return f"{ans.get('year', '')}-{str(ans.get('month', '')).zfill(2)}-{str(ans.get('day', '')).zfill(2)}"
+
+
+def test_format_date_matches_baseline_rendering():
+    answers = [
+        {"year": 2024, "month": 5, "day": 3},
+        {"year": 2024, "month": 12, "day": 31},
+        {"month": 5, "day": 3},  # includeYear=false
+        {"year": 2024},
+        {},
+    ]
+    for ans in answers:
+        assert _format_date(ans) == _baseline_format_date(ans)
+    assert _format_date({"month": 5, "day": 3}) == "-05-03"
+    assert _extract_dates([{}]) == "-00-00"
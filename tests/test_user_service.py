@@ -0,0 +1,36 @@
+# tests/test_user_service.py
+import asyncio
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from beanie import PydanticObjectId
+from fastapi import HTTPException, status
+from pymongo.errors import DuplicateKeyError
+
+# Without a .env file the configs fall back to the process environment
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+
+from app.schemas.user import UserUpdate  # noqa: E402
+from app.services.user_service import UserService  # noqa: E402
+
+
+def test_update_user_to_taken_email_raises_conflict():
+    """Changing a user's email to one already in use is a 409, not a 500."""
+    query = MagicMock()
+    query.update = AsyncMock(
+        side_effect=DuplicateKeyError("E11000 duplicate key error")
+    )
+    with patch("app.services.user_service.User") as user_model:
+        user_model.find_one.return_value = query
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(
+                UserService().update_user(
+                    PydanticObjectId(),
+                    UserUpdate(email="taken@example.com"),
+                    changer_user_id=PydanticObjectId(),
+                )
+            )
+
+    assert exc_info.value.status_code == status.HTTP_409_CONFLICT
+    assert exc_info.value.detail == "User with this email already exists."